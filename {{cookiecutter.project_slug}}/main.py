@@ -8,6 +8,7 @@ import argparse
 import asyncio
 import os
 import sys
+from functools import lru_cache
 from typing import Optional
 
 from fastapi import FastAPI
@@ -92,12 +93,15 @@ async def run_cli_mode() -> None:
             print(f"❌ Error: {e}")
 
 
+@lru_cache(maxsize=1)
 def create_app() -> FastAPI:
     """
     Factory function to create FastAPI application.
 
     This function is called by uvicorn in factory mode to avoid
-    import-time side effects when running in CLI mode.
+    import-time side effects when running in CLI mode. The application is
+    built once per process; later calls return the same instance. Use
+    create_app.cache_clear() to build a fresh one (e.g. in tests).
 
     Returns:
         FastAPI: Configured application instance
@@ -105,10 +109,12 @@ def create_app() -> FastAPI:
     # Lazy import API components to avoid side effects in CLI mode
     try:
         from src.api.factory import create_api
+        from src.core.config import log_settings_summary
         from src.core.logger import setup_logging
 
         # Setup logging first
         setup_logging()
+        log_settings_summary()
 
         # Create API with settings if available
         if settings:
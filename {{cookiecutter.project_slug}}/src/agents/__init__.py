@@ -5,8 +5,24 @@ This package contains AI agent instances for the {{cookiecutter.project_name}}.
 Each agent is defined using pydantic-ai's native Agent syntax.
 
 The demo_agent serves as an example and starting point for building your own agents.
+Agents themselves are only constructed when first used.
 """
 
-from .demo_agent import DemoDeps, demo_agent, handle_demo_agent
+from typing import TYPE_CHECKING, Any
 
-__all__ = ["demo_agent", "DemoDeps", "handle_demo_agent"]
+from .demo_agent import DemoDeps, get_demo_agent, handle_demo_agent
+
+if TYPE_CHECKING:
+    from .demo_agent import demo_agent
+else:
+    # The import above bound the submodule as `demo_agent`; unbind it once,
+    # here, so the name resolves to the lazily built agent via __getattr__
+    del demo_agent
+
+__all__ = ["demo_agent", "get_demo_agent", "DemoDeps", "handle_demo_agent"]
+
+
+def __getattr__(name: str) -> Any:
+    if name == "demo_agent":
+        return get_demo_agent()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
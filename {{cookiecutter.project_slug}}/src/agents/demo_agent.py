@@ -5,7 +5,8 @@ A simple demonstration agent for the {{cookiecutter.project_name}}.
 """
 
 from datetime import datetime
-from typing import Optional
+from functools import lru_cache
+from typing import Any, Optional
 
 from pydantic import BaseModel
 from pydantic_ai import Agent
@@ -19,18 +20,37 @@ class DemoDeps(BaseModel):
     user_name: Optional[str] = None
 
 
-# Create the demo agent
-demo_agent = Agent(
-    model=get_demo_model(),
-    deps_type=DemoDeps,
-    system_prompt="You are a helpful AI assistant. Be friendly and concise.",
-)
-
-
-@demo_agent.tool_plain
 def get_current_time() -> str:
     """Get the current time."""
-    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    # Same "%Y-%m-%d %H:%M:%S" output without strftime's format parsing
+    return datetime.now().isoformat(sep=" ", timespec="seconds")
+
+
+@lru_cache(maxsize=1)
+def get_demo_agent() -> Agent[DemoDeps, str]:
+    """
+    Get the demo agent, creating it on first use.
+
+    The model lookup and Agent construction are deferred until the agent is
+    actually needed instead of running at import time.
+
+    Returns:
+        Shared demo agent instance
+    """
+    agent = Agent(
+        model=get_demo_model(),
+        deps_type=DemoDeps,
+        system_prompt="You are a helpful AI assistant. Be friendly and concise.",
+    )
+    agent.tool_plain(get_current_time)
+    return agent
+
+
+def __getattr__(name: str) -> Any:
+    # Keep `demo_agent` importable while constructing it lazily
+    if name == "demo_agent":
+        return get_demo_agent()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 async def handle_demo_agent(user_input: str, deps: Optional[DemoDeps] = None) -> str:
@@ -47,15 +67,27 @@ async def handle_demo_agent(user_input: str, deps: Optional[DemoDeps] = None) ->
     if deps is None:
         deps = DemoDeps()
 
+    # Only the agent construction and run are guarded; the happy path
+    # returns outside of any exception handling
     try:
-        if demo_agent.model is None:
-            return (
-                f"Demo response to '{user_input}': No LLM configured. "
-                "Set up API keys in .env file."
-            )
+        demo_agent = get_demo_agent()
+    except Exception as e:
+        return _fallback_response(user_input, e)
 
-        result = await demo_agent.run(user_input, deps=deps)
-        return result.output
+    if demo_agent.model is None:
+        return (
+            f"Demo response to '{user_input}': No LLM configured. "
+            "Set up API keys in .env file."
+        )
 
+    try:
+        result = await demo_agent.run(user_input, deps=deps)
     except Exception as e:
-        return f"Demo fallback response to '{user_input}': Error occurred - {str(e)}"
+        return _fallback_response(user_input, e)
+
+    return result.output
+
+
+def _fallback_response(user_input: str, error: Exception) -> str:
+    """Build the demo fallback response for a failed agent call."""
+    return f"Demo fallback response to '{user_input}': Error occurred - {error}"
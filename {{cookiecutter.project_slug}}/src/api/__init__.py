@@ -2,9 +2,27 @@
 API Package
 
 Main API package for {{cookiecutter.project_name}}.
+
+Submodules are imported lazily (PEP 562) so that importing ``src.api`` does
+not pull in the router tree, agents and stores until they are needed.
 """
 
-from .factory import create_api, mount_api
-from .router import router
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .factory import create_api, mount_api
+    from .router import router
 
 __all__ = ["router", "create_api", "mount_api"]
+
+
+def __getattr__(name: str) -> Any:
+    if name == "router":
+        from .router import router
+
+        return router
+    if name in ("create_api", "mount_api"):
+        from . import factory
+
+        return getattr(factory, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -21,7 +21,8 @@ logger = get_logger(__name__)
 def _log_exception(request: Request, exc: Exception, status_code: int) -> None:
     """Log exception with appropriate level based on status code."""
     msg = "Unhandled exception in %s %s: %s"
-    args = (request.method, request.url.path, str(exc))
+    scope = request.scope
+    args = (scope["method"], scope["path"], str(exc))
 
     if status_code >= 500:
         logger.error(msg, *args, exc_info=True)
@@ -35,13 +36,17 @@ def _build_response(
     error: ErrorDetail, request: Request, status_code: int
 ) -> JSONResponse:
     """Build standardized error response."""
-    request_id = getattr(request.state, "request_id", None)
+    # Read straight from the ASGI scope instead of building URL/State objects
+    scope = request.scope
+    request_id = scope.get("state", {}).get("request_id")
 
-    payload = ErrorResponse(
+    # The envelope only wraps an already built ErrorDetail and scope strings,
+    # so construct it without running the validator again
+    payload = ErrorResponse.model_construct(
         error=error,
         request_id=request_id,
-        path=request.url.path,
-        method=request.method,
+        path=scope["path"],
+        method=scope["method"],
     )
 
     # Add X-Request-ID header for better traceability
@@ -10,15 +10,16 @@ from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
+from fastapi.responses import ORJSONResponse
 
 from src.api.errors import register_exception_handlers
 from src.api.middleware import (
     RequestIDMiddleware,
     RequestLoggingMiddleware,
 )
-from src.api.router import router
+from src.api.v1 import V1_ROUTERS
 from src.core.config import settings
-from src.core.logger import get_logger
+from src.core.logger import get_logger, stop_logging_listener
 
 logger = get_logger(__name__)
 
@@ -94,6 +95,9 @@ def setup_logging_middleware(app: FastAPI) -> None:
     # Request ID middleware (ensures all requests have IDs)
     app.add_middleware(RequestIDMiddleware)
 
+    # Flush queued log records on shutdown
+    app.add_event_handler("shutdown", stop_logging_listener)
+
     logger.info("Request logging and ID middleware configured")
 
 
@@ -181,6 +185,23 @@ def setup_metrics_hooks(app: FastAPI) -> None:
     logger.info("Basic metrics hooks configured")
 
 
+def include_api_routes(app: FastAPI, prefix: str = "/api") -> None:
+    """
+    Register all versioned endpoint routers directly on the application.
+
+    Endpoint routers are included in a single pass instead of through the
+    intermediate ``src.api.router.router``, so each route is copied once.
+
+    Args:
+        app: FastAPI application instance
+        prefix: Prefix for mounting the API routes
+    """
+    for endpoint_router, router_prefix, tags in V1_ROUTERS:
+        app.include_router(
+            endpoint_router, prefix=f"{prefix}/v1{router_prefix}", tags=tags
+        )
+
+
 def create_api(
     title: str = "{{cookiecutter.project_name}} API",
     description: str = "API for AI {{cookiecutter.project_name}}",
@@ -196,6 +217,8 @@ def create_api(
     """
     Create and configure FastAPI application with all middleware.
 
+    Responses are serialized with orjson unless a route sets its own class.
+
     Args:
         title: API title
         description: API description
@@ -218,6 +241,7 @@ def create_api(
         docs_url=docs_url,
         redoc_url=redoc_url,
         debug=settings.debug,
+        default_response_class=ORJSONResponse,
     )
 
     # Setup middleware in reverse order (last added = first executed)
@@ -243,8 +267,8 @@ def create_api(
     # Logfire instrumentation (should be after middleware setup)
     setup_logfire_instrumentation(app)
 
-    # Mount API router
-    app.include_router(router, prefix=mount_prefix)
+    # Mount API routes
+    include_api_routes(app, prefix=mount_prefix)
 
     logger.info("API factory created: %s v%s", title, version)
     return app
@@ -288,7 +312,7 @@ def mount_api(
     # Logfire instrumentation
     setup_logfire_instrumentation(app)
 
-    # Mount router
-    app.include_router(router, prefix=prefix)
+    # Mount API routes
+    include_api_routes(app, prefix=prefix)
 
     logger.info("API components mounted to existing app with prefix: %s", prefix)
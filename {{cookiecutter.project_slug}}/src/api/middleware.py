@@ -4,83 +4,103 @@ FastAPI Middleware
 Simple middleware for request logging.
 """
 
+import logging
 import time
 import uuid
-from typing import Awaitable, Callable
+from typing import Awaitable, Callable, FrozenSet
 
 from fastapi import Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from src.core.logger import get_logger
 
 logger = get_logger(__name__)
 
-
-class RequestLoggingMiddleware(BaseHTTPMiddleware):
+# Monotonic clock for request durations
+_perf = time.perf_counter
+
+# Log method per status class (status // 100): 4xx -> warning, 5xx -> error
+_LOG_BY_STATUS_CLASS = (
+    logger.info,
+    logger.info,
+    logger.info,
+    logger.info,
+    logger.warning,
+    logger.error,
+)
+
+# Probe and documentation paths that are not worth a log line per hit
+DEFAULT_SKIP_PATHS: FrozenSet[str] = frozenset(
+    {
+        "/health",
+        "/v1/health",
+        "/api/v1/health",
+        "/metrics",
+        "/favicon.ico",
+        "/docs",
+        "/redoc",
+        "/openapi.json",
+    }
+)
+
+
+class RequestLoggingMiddleware:
     """
     Simple middleware to log API requests and responses.
+
+    Implemented as a pure ASGI middleware rather than ``BaseHTTPMiddleware``
+    to avoid the extra task group and memory stream created per request.
     """
 
-    async def dispatch(
-        self, request: Request, call_next: Callable[[Request], Awaitable[Response]]
-    ) -> Response:
+    def __init__(
+        self, app: ASGIApp, skip_paths: FrozenSet[str] = DEFAULT_SKIP_PATHS
+    ) -> None:
         """
-        Process request and log basic information.
-
         Args:
-            request: FastAPI request object
-            call_next: Next middleware/handler in chain
+            app: Next ASGI application in the chain
+            skip_paths: Exact request paths that are passed through without logging
+        """
+        self.app = app
+        self.skip_paths = skip_paths
 
-        Returns:
-            Response: HTTP response
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
+        Process request and log basic information.
 
-        start_time = time.time()
-        method = request.method
-        path = request.url.path
-        client_ip = request.client.host if request.client else "unknown"
-        request_id = getattr(request.state, "request_id", "unknown")
+        Args:
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel
+        """
+        if scope["type"] != "http" or scope["path"] in self.skip_paths:
+            await self.app(scope, receive, send)
+            return
+
+        start_time = _perf()
+        method = scope["method"]
+        path = scope["path"]
+        request_id = scope.get("state", {}).get("request_id", "unknown")
+        status_code = 500
+
+        # Log request start (debug level); client lookup only when it is logged
+        if logger.isEnabledFor(logging.DEBUG):
+            client = scope.get("client")
+            client_ip = client[0] if client else "unknown"
+            logger.debug(
+                "Request: %s %s from %s [%s]", method, path, client_ip, request_id
+            )
 
-        # Log request start (debug level)
-        logger.debug("Request: %s %s from %s [%s]", method, path, client_ip, request_id)
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
 
         try:
-            response = await call_next(request)
-            duration = time.time() - start_time
-
-            # Log request completion
-            if response.status_code >= 500:
-                logger.error(
-                    "%s %s - %d (%.3fs) [%s]",
-                    method,
-                    path,
-                    response.status_code,
-                    duration,
-                    request_id,
-                )
-            elif response.status_code >= 400:
-                logger.warning(
-                    "%s %s - %d (%.3fs) [%s]",
-                    method,
-                    path,
-                    response.status_code,
-                    duration,
-                    request_id,
-                )
-            else:
-                logger.info(
-                    "%s %s - %d (%.3fs) [%s]",
-                    method,
-                    path,
-                    response.status_code,
-                    duration,
-                    request_id,
-                )
-
-            return response
-
+            await self.app(scope, receive, send_wrapper)
         except Exception as e:
-            duration = time.time() - start_time
+            duration = _perf() - start_time
             logger.error(
                 "Request failed: %s %s - %s (%.3fs) [%s]",
                 method,
@@ -92,6 +112,19 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
             )
             raise
 
+        duration = _perf() - start_time
+
+        # Log request completion
+        log_fn = _LOG_BY_STATUS_CLASS[min(status_code // 100, 5)]
+        log_fn(
+            "%s %s - %d (%.3fs) [%s]",
+            method,
+            path,
+            status_code,
+            duration,
+            request_id,
+        )
+
 
 class RequestIDMiddleware(BaseHTTPMiddleware):
     """
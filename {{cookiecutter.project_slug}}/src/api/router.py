@@ -1,14 +1,17 @@
 """
 FastAPI router for the {{cookiecutter.project_name}} API.
 
-This module defines the main FastAPI router, including the version 1 router.
+This module defines the main FastAPI router, including the version 1 endpoints.
+The application factory registers the endpoint routers directly; this router is
+kept for code that includes the whole API into its own router.
 """
 
 from fastapi import APIRouter
 
-from src.api.v1 import router as v1_router
+from src.api.v1 import V1_ROUTERS
 
 router = APIRouter()
-router.include_router(v1_router, prefix="/v1")
+for endpoint_router, prefix, tags in V1_ROUTERS:
+    router.include_router(endpoint_router, prefix=f"/v1{prefix}", tags=tags)
 
 __all__ = ["router"]
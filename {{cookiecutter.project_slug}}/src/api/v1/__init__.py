@@ -4,12 +4,19 @@ API Version 1 Package
 Version 1 of the {{cookiecutter.project_name}} API endpoints.
 """
 
+from enum import Enum
+from typing import List, Tuple, Union
+
 from fastapi import APIRouter
 
 from .endpoints import demo_router, health_router
 
-router = APIRouter()
-router.include_router(health_router, tags=["health"])
-router.include_router(demo_router, prefix="/demo", tags=["demo"])
+# Endpoint routers mounted under "/v1" as (router, prefix, tags).
+# Kept as a flat table so routes are copied once instead of through an
+# intermediate v1 APIRouter.
+V1_ROUTERS: Tuple[Tuple[APIRouter, str, List[Union[str, Enum]]], ...] = (
+    (health_router, "", ["health"]),
+    (demo_router, "/demo", ["demo"]),
+)
 
-__all__ = ["router"]
+__all__ = ["V1_ROUTERS"]
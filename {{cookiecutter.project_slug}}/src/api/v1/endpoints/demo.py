@@ -4,16 +4,29 @@ Demo API Endpoints
 Simple demonstration endpoints for the {{cookiecutter.project_name}}.
 """
 
+from typing import Any, Dict, Union
+
 from fastapi import APIRouter
+from fastapi.responses import ORJSONResponse
 
 from src.agents import handle_demo_agent
+from src.api.orjson_route import ORJSONRoute
 from src.api.schemas.error import ErrorResponse
 from src.api.v1.schemas.requests import DemoChatRequest
 from src.api.v1.schemas.responses import DemoChatResponse
 from src.core.error_codes import AgentErrorCode
 from src.core.exceptions import AgentException
 
-router = APIRouter()
+router = APIRouter(route_class=ORJSONRoute, default_response_class=ORJSONResponse)
+
+# Shared route metadata, built once at import. Tags are applied when the
+# router is included (see src.api.v1.V1_ROUTERS), so routes don't repeat them.
+_CHAT_RESPONSES: Dict[Union[int, str], Dict[str, Any]] = {
+    400: {"model": ErrorResponse, "description": "Bad request"},
+    422: {"model": ErrorResponse, "description": "Validation error"},
+    500: {"model": ErrorResponse, "description": "Internal server error"},
+    503: {"model": ErrorResponse, "description": "Agent unavailable"},
+}
 
 
 @router.post(
@@ -21,15 +34,9 @@ router = APIRouter()
     response_model=DemoChatResponse,
     summary="Chat with Demo Agent",
     description="Send a message to the demo agent and get a response",
-    tags=["demo"],
-    responses={
-        400: {"model": ErrorResponse, "description": "Bad request"},
-        422: {"model": ErrorResponse, "description": "Validation error"},
-        500: {"model": ErrorResponse, "description": "Internal server error"},
-        503: {"model": ErrorResponse, "description": "Agent unavailable"},
-    },
+    responses=_CHAT_RESPONSES,
 )
-async def chat_with_agent(request: DemoChatRequest) -> DemoChatResponse:
+async def chat_with_agent(request: DemoChatRequest) -> ORJSONResponse:
     """
     Chat with the demo agent.
 
@@ -37,7 +44,7 @@ async def chat_with_agent(request: DemoChatRequest) -> DemoChatResponse:
         request: ChatRequest containing the message and optional context
 
     Returns:
-        ChatResponse: Agent's response
+        ORJSONResponse: Serialized DemoChatResponse with the agent's response
 
     Raises:
         HTTPException: If agent is not available or processing fails
@@ -46,9 +53,13 @@ async def chat_with_agent(request: DemoChatRequest) -> DemoChatResponse:
         # Handle the chat request
         response = await handle_demo_agent(request.message)
 
-        return DemoChatResponse(
+        # Fields are already typed (validated request, str agent output), so
+        # skip a second validation pass when building the response model, and
+        # serialize it here instead of through FastAPI's response_model pass
+        payload = DemoChatResponse.model_construct(
             response=response, session_id=request.session_id, status="success"
         )
+        return ORJSONResponse(payload.model_dump())
 
     except Exception as e:
         raise AgentException.wrap(
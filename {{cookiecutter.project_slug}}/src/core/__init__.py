@@ -6,6 +6,9 @@ Core configuration, error handling, and foundational components for AI Agents.
 
 # ruff: noqa: F401  # All imports are re-exported via __all__
 
+import importlib
+from typing import TYPE_CHECKING, Any, Dict
+
 from .config import Settings, settings  # noqa: F401
 from .error_codes import (  # noqa: F401
     ERROR_CODE_MAP,
@@ -29,14 +32,6 @@ from .exceptions import (  # noqa: F401
     LLMCallException,
     RequestParamException,
 )
-from .llm_factory import create_fallback_model, create_llm_model  # noqa: F401
-from .llm_registry import (  # noqa: F401
-    get_default_model,
-    get_demo_model,
-    get_fallback_model,
-    get_model_by_name,
-    list_available_models,
-)
 from .logfire_config import (  # noqa: F401
     custom_request_attributes_mapper,
     get_logfire_environment,
@@ -50,6 +45,27 @@ from .logfire_config import (  # noqa: F401
 from .logger import get_logger  # noqa: F401
 from .prompt_loader import load_prompt  # noqa: F401
 
+if TYPE_CHECKING:
+    from .llm_factory import create_fallback_model, create_llm_model
+    from .llm_registry import (
+        get_default_model,
+        get_demo_model,
+        get_fallback_model,
+        get_model_by_name,
+        list_available_models,
+    )
+
+# LLM helpers pull in pydantic_ai, so they are imported on first access
+_LAZY_IMPORTS: Dict[str, str] = {
+    "create_llm_model": ".llm_factory",
+    "create_fallback_model": ".llm_factory",
+    "get_demo_model": ".llm_registry",
+    "get_default_model": ".llm_registry",
+    "get_fallback_model": ".llm_registry",
+    "list_available_models": ".llm_registry",
+    "get_model_by_name": ".llm_registry",
+}
+
 __all__ = [
     # Configuration
     "Settings",
@@ -97,3 +113,12 @@ __all__ = [
     "get_logfire_environment",
     "custom_request_attributes_mapper",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is not None:
+        value = getattr(importlib.import_module(module_name, __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -4,11 +4,30 @@ Configuration
 Application settings and environment configuration for {{cookiecutter.project_name}}.
 """
 
-from typing import List, Literal, Optional
+import logging
+from functools import cached_property, lru_cache
+from typing import Dict, List, Literal, Optional, Tuple
 
 from pydantic import Field, SecretStr, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+# Plain stdlib logger: src.core.logger depends on settings, so it can't be used here
+logger = logging.getLogger("{{cookiecutter.project_slug}}.config")
+
+
+# Business model configurations: name -> (provider field, model name field).
+# Register new agents here after adding their two Settings fields.
+AI_MODEL_FIELDS: Dict[str, Tuple[str, str]] = {
+    "default": ("ai__default_model__provider", "ai__default_model__name"),
+    "demo": ("ai__demo_agent__provider", "ai__demo_agent__model_name"),
+    "fallback": ("ai__fallback__provider", "ai__fallback__model_name"),
+}
+
+
+def _split_comma_separated(value: str) -> List[str]:
+    """Split a comma-separated setting into stripped items."""
+    return [item.strip() for item in value.split(",")]
+
 
 class Settings(BaseSettings):
     """
@@ -79,10 +98,21 @@ class Settings(BaseSettings):
         default=30, ge=0, description="Pool timeout in seconds"
     )
     database__pool_recycle: int = Field(
-        default=3600, ge=0, description="Pool recycle time in seconds"
+        default=300, ge=0, description="Pool recycle time in seconds"
     )
     database__pool_pre_ping: bool = Field(
-        default=True, description="Enable pool pre-ping"
+        default=False,
+        description="Enable pool pre-ping on the psycopg2 engine (a SELECT 1 per "
+        "checkout; TCP keepalives and pool_recycle already catch dead connections). "
+        "The asyncpg engine always pre-pings",
+    )
+    database__pool_reset_on_return: Literal["rollback", "commit", "none"] = Field(
+        default="rollback",
+        description="Reset run when a connection returns to the pool ('none' skips it)",
+    )
+    database__use_nullpool: bool = Field(
+        default=False,
+        description="Disable in-process pooling (NullPool), e.g. behind PgBouncer",
     )
 
     # Redis settings (optional)
@@ -90,6 +120,10 @@ class Settings(BaseSettings):
     redis__port: int = Field(default=6379, ge=1, le=65535, description="Redis port")
     redis__db: int = Field(default=0, ge=0, le=15, description="Redis database number")
     redis__password: Optional[str] = Field(default=None, description="Redis password")
+    redis__unix_socket_path: Optional[str] = Field(
+        default=None,
+        description="Unix socket path for a colocated Redis; overrides host/port",
+    )
     redis__ssl: bool = Field(
         default=False, description="Enable SSL/TLS for Redis connection"
     )
@@ -102,7 +136,7 @@ class Settings(BaseSettings):
 
     # Lock configuration
     redis_lock__retry_sleep_interval: float = Field(
-        default=0.1, description="Lock retry sleep interval in seconds"
+        default=0.1, description="Maximum lock retry backoff interval in seconds"
     )
 
     # Health check configuration
@@ -143,7 +177,7 @@ class Settings(BaseSettings):
         default="openai/gpt-4o-mini", description="Model name for demo agent"
     )
 
-    # Add more business-specific agents as needed:
+    # Add more business-specific agents as needed (and register them in AI_MODEL_FIELDS):
     # ai__chat_agent__provider: str = Field(default="anthropic", description="Provider for chat agent")
     # ai__chat_agent__model_name: str = Field(default="claude-3-5-sonnet-20241022", description="Model name for chat agent")
     # ai__analysis_agent__provider: str = Field(default="google", description="Provider for analysis agent")
@@ -196,6 +230,10 @@ class Settings(BaseSettings):
     )
 
     # Logging file settings (optional)
+    log__file_enabled: bool = Field(
+        default=True,
+        description="Write logs to a rotating file (disable when stdout is the sink)",
+    )
     log__dir: str = Field(
         default="logs", description="Directory where log files are stored"
     )
@@ -223,26 +261,34 @@ class Settings(BaseSettings):
         description="Allowed file extensions (comma-separated)",
     )
 
-    # Properties for list conversion
-    @property
+    # Properties for list conversion (computed once per Settings instance)
+    @cached_property
     def cors_allow_origins_list(self) -> List[str]:
         """Convert comma-separated origins to list."""
-        return [origin.strip() for origin in str(self.cors__allow_origins).split(",")]
+        return _split_comma_separated(self.cors__allow_origins)
 
-    @property
+    @cached_property
     def cors_allow_methods_list(self) -> List[str]:
         """Convert comma-separated methods to list."""
-        return [method.strip() for method in str(self.cors__allow_methods).split(",")]
+        return _split_comma_separated(self.cors__allow_methods)
 
-    @property
+    @cached_property
     def cors_allow_headers_list(self) -> List[str]:
         """Convert comma-separated headers to list."""
-        return [header.strip() for header in str(self.cors__allow_headers).split(",")]
+        return _split_comma_separated(self.cors__allow_headers)
 
-    @property
+    @cached_property
     def upload_allowed_extensions_list(self) -> List[str]:
         """Convert comma-separated extensions to list."""
-        return [ext.strip() for ext in str(self.upload_allowed_extensions).split(",")]
+        return _split_comma_separated(self.upload_allowed_extensions)
+
+    @cached_property
+    def ai_models(self) -> Dict[str, Tuple[str, str]]:
+        """Resolve AI_MODEL_FIELDS to a name -> (provider, model_name) table."""
+        return {
+            name: (getattr(self, provider_field), getattr(self, model_field))
+            for name, (provider_field, model_field) in AI_MODEL_FIELDS.items()
+        }
 
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -253,10 +299,15 @@ class Settings(BaseSettings):
     )
 
 
+@lru_cache(maxsize=1)
 def create_settings() -> Settings:
     """
     Create and validate settings instance.
 
+    The instance is cached, so repeated calls do not re-read the environment.
+    Call ``create_settings.cache_clear()`` after changing the environment
+    (e.g. in tests) to build a fresh instance.
+
     Returns:
         Settings: Configured settings instance
 
@@ -264,42 +315,49 @@ def create_settings() -> Settings:
         RuntimeError: If configuration validation fails
     """
     try:
-        settings_instance = Settings()
-
-        # Environment validation is now handled by Literal type annotation
-
-        # Count configured API keys
-        api_keys_count = len(
-            [
-                key
-                for key in [
-                    settings_instance.ai__openai_api_key,
-                    settings_instance.ai__anthropic_api_key,
-                    settings_instance.ai__google_api_key,
-                    settings_instance.ai__openrouter_api_key,
-                ]
-                if key
-            ]
+        return Settings()
+    except Exception as e:
+        logger.error(
+            "Configuration loading failed: %s. "
+            "Please ensure all required environment variables are set",
+            e,
         )
+        raise RuntimeError(f"Configuration loading failed: {e}") from e
 
-        print("🔧 Configuration loaded successfully")
-        print(f"   Environment: {settings_instance.environment}")
-        print(f"   Debug mode: {settings_instance.debug}")
-        print(f"   Log level: {settings_instance.log_level}")
-        print(f"   API keys configured: {api_keys_count}/4")
 
-        if api_keys_count == 0:
-            print("⚠️  Warning: No AI API keys configured. Some features may not work.")
-            print(
-                "   Set AI__OPENAI_API_KEY, AI__ANTHROPIC_API_KEY, etc. in your .env file"
-            )
+def log_settings_summary() -> None:
+    """
+    Log a summary of the active configuration.
+
+    Called once logging is configured (settings are created at import, before
+    any handler exists, so the summary cannot be logged there).
+    """
+    # Count configured API keys
+    api_keys_count = sum(
+        1
+        for key in (
+            settings.ai__openai_api_key,
+            settings.ai__anthropic_api_key,
+            settings.ai__google_api_key,
+            settings.ai__openrouter_api_key,
+        )
+        if key
+    )
 
-        return settings_instance
+    logger.info(
+        "Configuration loaded - Environment: %s, Debug: %s, Log level: %s, "
+        "API keys configured: %d/4",
+        settings.environment,
+        settings.debug,
+        settings.log_level,
+        api_keys_count,
+    )
 
-    except Exception as e:
-        print(f"❌ Configuration loading failed: {e}")
-        print("Please ensure all required environment variables are set")
-        raise RuntimeError(f"Configuration loading failed: {e}") from e
+    if api_keys_count == 0:
+        logger.warning(
+            "No AI API keys configured, some features may not work. "
+            "Set AI__OPENAI_API_KEY, AI__ANTHROPIC_API_KEY, etc. in your .env file"
+        )
 
 
 # Global configuration instance
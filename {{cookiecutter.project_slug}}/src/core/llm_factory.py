@@ -5,25 +5,49 @@ Simple factory function to create LLM models based on provider and model name.
 Also supports creating FallbackModel instances for improved reliability.
 """
 
-from typing import Any, Optional
+import importlib
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional
 
+from pydantic import SecretStr
 from pydantic_ai.models import Model
-from pydantic_ai.models.fallback import FallbackModel
 
 from .config import settings
 from .error_codes import InternalServiceErrorCode
 from .exceptions import InternalServiceException
 
 
+@lru_cache(maxsize=None)
+def _load_sdk_class(module_path: str, class_name: str) -> Any:
+    """
+    Import a provider SDK class on first use and cache it.
+
+    Provider SDKs are only loaded for providers that are actually used, and
+    later model builds skip the import machinery entirely.
+    """
+    return getattr(importlib.import_module(module_path), class_name)
+
+
 def _extract_secret(secret_str: Any) -> Optional[str]:
     """Safely extract secret value from SecretStr or return None."""
     if secret_str is None:
         return None
-    if hasattr(secret_str, "get_secret_value"):
-        return str(secret_str.get_secret_value())
+    if isinstance(secret_str, SecretStr):
+        return secret_str.get_secret_value()
     return str(secret_str)
 
 
+def _shared_http_client() -> Any:
+    """
+    Return the httpx.AsyncClient shared by all httpx-based providers.
+
+    pydantic_ai caches this client and recreates it if it has been closed, so
+    OpenAI, OpenRouter and Anthropic models reuse one connection pool instead
+    of one per provider.
+    """
+    return _load_sdk_class("pydantic_ai.models", "cached_async_http_client")()
+
+
 def create_llm_model(model_name: str, provider: str) -> Model:
     """
     Create an LLM model instance based on provider and model name.
@@ -38,29 +62,19 @@ def create_llm_model(model_name: str, provider: str) -> Model:
     Raises:
         InternalServiceException: If provider is unsupported or model creation fails
     """
+    builder = _PROVIDER_BUILDERS.get(provider)
+    if builder is None:
+        raise InternalServiceException(
+            message=f"Unsupported provider: {provider}",
+            error_code=InternalServiceErrorCode.OPERATION_FAILED,
+            details={
+                "provider": provider,
+                "supported_providers": SUPPORTED_PROVIDERS,
+            },
+        )
+
     try:
-        if provider == "openai":
-            return _create_openai_model(model_name)
-        elif provider == "google":
-            return _create_google_model(model_name)
-        elif provider == "openrouter":
-            return _create_openrouter_model(model_name)
-        elif provider == "anthropic":
-            return _create_anthropic_model(model_name)
-        else:
-            raise InternalServiceException(
-                message=f"Unsupported provider: {provider}",
-                error_code=InternalServiceErrorCode.OPERATION_FAILED,
-                details={
-                    "provider": provider,
-                    "supported_providers": [
-                        "openai",
-                        "google",
-                        "openrouter",
-                        "anthropic",
-                    ],
-                },
-            )
+        return builder(model_name)
     except InternalServiceException:
         raise
     except Exception as e:
@@ -75,8 +89,8 @@ def create_llm_model(model_name: str, provider: str) -> Model:
 
 def _create_openai_model(model_name: str) -> Model:
     """Create OpenAI model instance."""
-    from pydantic_ai.models.openai import OpenAIChatModel
-    from pydantic_ai.providers.openai import OpenAIProvider
+    OpenAIChatModel = _load_sdk_class("pydantic_ai.models.openai", "OpenAIChatModel")
+    OpenAIProvider = _load_sdk_class("pydantic_ai.providers.openai", "OpenAIProvider")
 
     api_key = _extract_secret(settings.ai__openai_api_key)
     if api_key is None:
@@ -85,14 +99,14 @@ def _create_openai_model(model_name: str) -> Model:
             error_code=InternalServiceErrorCode.OPERATION_FAILED,
             details={"provider": "openai", "model_name": model_name},
         )
-    provider = OpenAIProvider(api_key=api_key)
+    provider = OpenAIProvider(api_key=api_key, http_client=_shared_http_client())
     return OpenAIChatModel(model_name, provider=provider)
 
 
 def _create_google_model(model_name: str) -> Model:
     """Create Google model instance."""
-    from pydantic_ai.models.google import GoogleModel
-    from pydantic_ai.providers.google import GoogleProvider
+    GoogleModel = _load_sdk_class("pydantic_ai.models.google", "GoogleModel")
+    GoogleProvider = _load_sdk_class("pydantic_ai.providers.google", "GoogleProvider")
 
     api_key = _extract_secret(settings.ai__google_api_key)
     if api_key is None:
@@ -107,8 +121,10 @@ def _create_google_model(model_name: str) -> Model:
 
 def _create_openrouter_model(model_name: str) -> Model:
     """Create OpenRouter model instance."""
-    from pydantic_ai.models.openai import OpenAIChatModel
-    from pydantic_ai.providers.openrouter import OpenRouterProvider
+    OpenAIChatModel = _load_sdk_class("pydantic_ai.models.openai", "OpenAIChatModel")
+    OpenRouterProvider = _load_sdk_class(
+        "pydantic_ai.providers.openrouter", "OpenRouterProvider"
+    )
 
     api_key = _extract_secret(settings.ai__openrouter_api_key)
     if api_key is None:
@@ -117,14 +133,16 @@ def _create_openrouter_model(model_name: str) -> Model:
             error_code=InternalServiceErrorCode.OPERATION_FAILED,
             details={"provider": "openrouter", "model_name": model_name},
         )
-    provider = OpenRouterProvider(api_key=api_key)
+    provider = OpenRouterProvider(api_key=api_key, http_client=_shared_http_client())
     return OpenAIChatModel(model_name, provider=provider)
 
 
 def _create_anthropic_model(model_name: str) -> Model:
     """Create Anthropic model instance."""
-    from pydantic_ai.models.anthropic import AnthropicModel
-    from pydantic_ai.providers.anthropic import AnthropicProvider
+    AnthropicModel = _load_sdk_class("pydantic_ai.models.anthropic", "AnthropicModel")
+    AnthropicProvider = _load_sdk_class(
+        "pydantic_ai.providers.anthropic", "AnthropicProvider"
+    )
 
     api_key = _extract_secret(settings.ai__anthropic_api_key)
     if api_key is None:
@@ -133,10 +151,35 @@ def _create_anthropic_model(model_name: str) -> Model:
             error_code=InternalServiceErrorCode.OPERATION_FAILED,
             details={"provider": "anthropic", "model_name": model_name},
         )
-    provider = AnthropicProvider(api_key=api_key)
+    provider = AnthropicProvider(api_key=api_key, http_client=_shared_http_client())
     return AnthropicModel(model_name, provider=provider)
 
 
+# Provider name -> model builder, used by create_llm_model for dispatch
+_PROVIDER_BUILDERS: Dict[str, Callable[[str], Model]] = {
+    "openai": _create_openai_model,
+    "google": _create_google_model,
+    "openrouter": _create_openrouter_model,
+    "anthropic": _create_anthropic_model,
+}
+
+SUPPORTED_PROVIDERS = tuple(_PROVIDER_BUILDERS)
+
+
+@lru_cache(maxsize=1)
+def _get_shared_fallback_model() -> Model:
+    """
+    Create the configured fallback model once and share it.
+
+    Every FallbackModel wraps the same fallback, so sharing it avoids building
+    a duplicate provider and HTTP client per primary model.
+    """
+    return create_llm_model(
+        model_name=settings.ai__fallback__model_name,
+        provider=settings.ai__fallback__provider,
+    )
+
+
 def create_fallback_model(primary_model_name: str, primary_provider: str) -> Model:
     """
     Create a FallbackModel instance with primary model and configured fallback model.
@@ -155,13 +198,11 @@ def create_fallback_model(primary_model_name: str, primary_provider: str) -> Mod
         # Create primary model
         primary_model = create_llm_model(primary_model_name, primary_provider)
 
-        # Create configured fallback model
-        fallback_model = create_llm_model(
-            model_name=settings.ai__fallback__model_name,
-            provider=settings.ai__fallback__provider,
-        )
+        # Reuse the configured fallback model shared by all FallbackModels
+        fallback_model = _get_shared_fallback_model()
 
         # Create FallbackModel with primary and fallback
+        FallbackModel = _load_sdk_class("pydantic_ai.models.fallback", "FallbackModel")
         return FallbackModel(primary_model, fallback_model)
 
     except InternalServiceException:
@@ -16,6 +16,7 @@ Usage:
     )
 """
 
+from functools import lru_cache
 from typing import Callable, Dict, Optional
 
 from pydantic_ai.models import Model
@@ -26,56 +27,55 @@ from src.core.llm_factory import (
     create_llm_model,
 )
 
+# Registered model name -> whether its getter wraps it in a FallbackModel.
+# Provider and model name for each entry come from config.AI_MODEL_FIELDS.
+_MODELS: Dict[str, bool] = {
+    "demo": True,
+    "default": True,
+    "fallback": False,
+}
 
-def get_demo_model() -> Model:
-    """
-    Get demo model.
-
-    Configuration is read from settings:
-    - ai__demo_agent__provider
-    - ai__demo_agent__model_name
 
-    Returns:
-        Configured demo model instance with fallback support
+def _make_model_getter(name: str, with_fallback: bool) -> Callable[[], Model]:
     """
-    return create_fallback_model(
-        primary_model_name=settings.ai__demo_agent__model_name,
-        primary_provider=settings.ai__demo_agent__provider,
-    )
+    Build a zero-argument getter for a registered model.
 
+    The getter builds the model on first call and returns the same instance
+    afterwards, since settings do not change for the life of the process.
 
-def get_default_model() -> Model:
-    """
-    Get default model.
-
-    Configuration is read from settings:
-    - ai__default_model__provider
-    - ai__default_model__name
+    Args:
+        name: Model name registered in config.AI_MODEL_FIELDS
+        with_fallback: Wrap the model in a FallbackModel if True
 
     Returns:
-        Configured default model instance with fallback support
+        Getter returning the configured model instance
     """
-    return create_fallback_model(
-        primary_model_name=settings.ai__default_model__name,
-        primary_provider=settings.ai__default_model__provider,
-    )
 
+    def getter() -> Model:
+        provider, model_name = settings.ai_models[name]
+        if with_fallback:
+            return create_fallback_model(
+                primary_model_name=model_name,
+                primary_provider=provider,
+            )
+        return create_llm_model(model_name=model_name, provider=provider)
+
+    getter.__name__ = getter.__qualname__ = f"get_{name}_model"
+    getter.__doc__ = (
+        f"Get {name} model"
+        f"{' with fallback support' if with_fallback else ' (no additional fallback)'}."
+    )
+    return lru_cache(maxsize=1)(getter)
 
-def get_fallback_model() -> Model:
-    """
-    Get fallback model (without additional fallback).
 
-    Configuration is read from settings:
-    - ai__fallback__provider
-    - ai__fallback__model_name
+_MODEL_GETTERS: Dict[str, Callable[[], Model]] = {
+    name: _make_model_getter(name, with_fallback)
+    for name, with_fallback in _MODELS.items()
+}
 
-    Returns:
-        Configured fallback model instance (direct, no additional fallback)
-    """
-    return create_llm_model(
-        model_name=settings.ai__fallback__model_name,
-        provider=settings.ai__fallback__provider,
-    )
+get_demo_model = _MODEL_GETTERS["demo"]
+get_default_model = _MODEL_GETTERS["default"]
+get_fallback_model = _MODEL_GETTERS["fallback"]
 
 
 def list_available_models() -> Dict[str, Callable[[], Model]]:
@@ -85,11 +85,7 @@ def list_available_models() -> Dict[str, Callable[[], Model]]:
     Returns:
         Dictionary of model names and their getter functions
     """
-    return {
-        "demo": get_demo_model,
-        "default": get_default_model,
-        "fallback": get_fallback_model,
-    }
+    return dict(_MODEL_GETTERS)
 
 
 def get_model_by_name(name: str) -> Optional[Model]:
@@ -102,6 +98,5 @@ def get_model_by_name(name: str) -> Optional[Model]:
     Returns:
         Model instance or None if not found
     """
-    models = list_available_models()
-    getter = models.get(name)
+    getter = _MODEL_GETTERS.get(name)
     return getter() if getter else None
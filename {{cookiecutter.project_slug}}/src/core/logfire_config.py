@@ -14,19 +14,22 @@ Usage:
 """
 
 import logging
-from typing import Any, Dict, Optional, Union
-
-import logfire
-from fastapi import FastAPI, Request, WebSocket
+import threading
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple, Union
 
 from src.core.config import settings
-from src.core.logger import setup_logfire_handler
+from src.core.logger import clear_tagged_logfire_cache, setup_logfire_handler
+
+if TYPE_CHECKING:
+    from fastapi import FastAPI, Request, WebSocket
 
 
 class _LogfireState:
     """Internal state management for logfire configuration."""
 
     def __init__(self) -> None:
+        # Serializes one-shot configuration and instrumentation
+        self.lock = threading.Lock()
         self.configured = False
         self.instrumented = False
         self.instrument_results: Dict[str, bool] = {
@@ -64,6 +67,16 @@ class _LogfireState:
 _state = _LogfireState()
 
 
+# Scrubbed path components whose values are kept
+_SCRUB_ALLOWED_KEYS = frozenset(
+    {
+        "sid",  # sid is used to identify the chat session, injected in logger.py
+        # prevent the LLM's input parameters from being redacted
+        "http.request.body.text",
+    }
+)
+
+
 def _custom_scrub_callback(match: Any) -> Any:
     """
     Custom scrubbing callback that allows session_id fields while keeping other protections.
@@ -74,22 +87,32 @@ def _custom_scrub_callback(match: Any) -> Any:
     Returns:
         The original value if it should be kept, None if it should be redacted
     """
-    # Get the path as a tuple of keys
-    path = match.path
-
-    allowed_keys = {
-        "sid", # sid is used to identify the chat session, injected in logger.py
-        "http.request.body.text", # prevent the LLM’s input parameters from being redacted. 
-    }
-    if any(str(part).lower() in allowed_keys for part in path):
-        return match.value
+    for part in match.path:
+        if part in _SCRUB_ALLOWED_KEYS or (
+            isinstance(part, str) and part.lower() in _SCRUB_ALLOWED_KEYS
+        ):
+            return match.value
 
     # For all other matches, use default behavior (redact)
     return None
 
 
+# Request value keys (lowercased) that are kept or redacted by the mapper
+_SESSION_KEYS = frozenset({"session_id", "sid"})
+_SECRET_KEYS = frozenset({"password", "token", "api_key", "secret"})
+
+
+def _summarize_upload(upload: Any) -> Dict[str, Any]:
+    """Describe an uploaded file by name, content type and size only."""
+    return {
+        "filename": getattr(upload, "filename", "unknown"),
+        "content_type": getattr(upload, "content_type", "unknown"),
+        "size": getattr(upload, "size", "unknown"),
+    }
+
+
 def custom_request_attributes_mapper(
-    request: Union[Request, WebSocket], attributes: Dict[str, Any]
+    request: Union["Request", "WebSocket"], attributes: Dict[str, Any]
 ) -> Optional[Dict[str, Any]]:
     """
     Custom request attributes mapper for logfire.
@@ -136,24 +159,17 @@ def custom_request_attributes_mapper(
 
     if attributes.get("values"):
         for key, value in attributes["values"].items():
+            lowered_key = key.lower()
             # Explicitly preserve session_id fields
-            if key.lower() in ["session_id", "sid"]:
+            if lowered_key in _SESSION_KEYS:
                 filtered_values[key] = value
                 session_id = value
             # Filter out sensitive information
-            elif key.lower() in ["password", "token", "api_key", "secret"]:
+            elif lowered_key in _SECRET_KEYS:
                 filtered_values[key] = "[REDACTED]"
             elif key == "file" and hasattr(value, "filename"):
                 # For file uploads, just log filename and size
-                filtered_values[key] = {
-                    "filename": getattr(value, "filename", "unknown"),
-                    "content_type": getattr(value, "content_type", "unknown"),
-                    "size": (
-                        getattr(value, "size", 0)
-                        if hasattr(value, "size")
-                        else "unknown"
-                    ),
-                }
+                filtered_values[key] = _summarize_upload(value)
             else:
                 filtered_values[key] = value
 
@@ -194,58 +210,82 @@ def setup_logfire() -> bool:
     if not settings.logfire__enabled or _state.is_configured():
         return _state.is_configured()
 
-    try:
-        config_kwargs: Dict[str, Any] = {
-            "service_name": settings.logfire__service_name,
-            "environment": settings.logfire__environment,
-        }
-
-        # Configure scrubbing to allow session_id fields
-        if settings.logfire__disable_scrubbing:
-            # Completely disable scrubbing if explicitly requested
-            config_kwargs["scrubbing"] = False
-        else:
-            # Use custom scrubbing options to allow session_id while keeping other protections
-            try:
-                config_kwargs["scrubbing"] = logfire.ScrubbingOptions(
-                    callback=_custom_scrub_callback
-                )
-            except (AttributeError, TypeError) as e:
-                # Fallback: if ScrubbingOptions is not available or API changed
-                logger.warning("ScrubbingOptions not available or API changed: %s", e)
-                logger.warning("Falling back to default scrubbing")
-                config_kwargs["scrubbing"] = True
-
-        # Handle token (SecretStr compatible)
-        if settings.logfire__token:
-            token_value: str
-            if hasattr(settings.logfire__token, "get_secret_value"):
-                token_value = settings.logfire__token.get_secret_value()
-            else:
-                token_value = str(settings.logfire__token)
-            config_kwargs["token"] = token_value
-        # Note: sample_rate is commented out as it's not supported in current version
-        # if settings.logfire__sample_rate is not None:
-        #     try:
-        #         config_kwargs["sample_rate"] = settings.logfire__sample_rate
-        #     except TypeError:
-        #         logging.warning("sample_rate parameter not supported in this logfire version")
-
-        logfire.configure(**config_kwargs)
-        startup_logger = logging.getLogger("{{cookiecutter.project_slug}}.startup")
-        startup_logger.info(
-            "Logfire initialized for service: %s", settings.logfire__service_name
-        )
+    with _state.lock:
+        if _state.is_configured():
+            return True
 
-        # Set up Logfire logging handler after configuration
-        setup_logfire_handler()
+        try:
+            import logfire
 
-        _state.set_configured(True)
-        return True
+            config_kwargs: Dict[str, Any] = {
+                "service_name": settings.logfire__service_name,
+                "environment": settings.logfire__environment,
+            }
 
-    except Exception as e:
-        logger.error("Failed to initialize logfire: %s", e)
-        return False
+            # Configure scrubbing to allow session_id fields
+            if settings.logfire__disable_scrubbing:
+                # Completely disable scrubbing if explicitly requested
+                config_kwargs["scrubbing"] = False
+            else:
+                # Use custom scrubbing options to allow session_id while keeping other protections
+                try:
+                    config_kwargs["scrubbing"] = logfire.ScrubbingOptions(
+                        callback=_custom_scrub_callback
+                    )
+                except (AttributeError, TypeError) as e:
+                    # Fallback: if ScrubbingOptions is not available or API changed
+                    logger.warning(
+                        "ScrubbingOptions not available or API changed: %s", e
+                    )
+                    # Leave "scrubbing" unset: logfire only accepts ScrubbingOptions,
+                    # False or None, and None selects the default scrubber
+                    logger.warning("Falling back to default scrubbing")
+
+            # Handle token (SecretStr compatible)
+            if settings.logfire__token:
+                token_value: str
+                if hasattr(settings.logfire__token, "get_secret_value"):
+                    token_value = settings.logfire__token.get_secret_value()
+                else:
+                    token_value = str(settings.logfire__token)
+                config_kwargs["token"] = token_value
+            # Note: sample_rate is commented out as it's not supported in current version
+            # if settings.logfire__sample_rate is not None:
+            #     try:
+            #         config_kwargs["sample_rate"] = settings.logfire__sample_rate
+            #     except TypeError:
+            #         logging.warning("sample_rate parameter not supported in this logfire version")
+
+            logfire.configure(**config_kwargs)
+            clear_tagged_logfire_cache()
+            startup_logger = logging.getLogger("{{cookiecutter.project_slug}}.startup")
+            startup_logger.info(
+                "Logfire initialized for service: %s", settings.logfire__service_name
+            )
+
+            # Set up Logfire logging handler after configuration
+            setup_logfire_handler()
+
+            _state.set_configured(True)
+            return True
+
+        except Exception as e:
+            logger.error("Failed to initialize logfire: %s", e)
+            return False
+
+
+# Library instrumentation: (result key, settings flag, logfire method,
+# {method option: settings field})
+_LIBRARY_INSTRUMENTS: Tuple[Tuple[str, str, str, Dict[str, str]], ...] = (
+    ("pydantic_ai", "logfire__instrument__pydantic_ai", "instrument_pydantic_ai", {}),
+    ("redis", "logfire__instrument__redis", "instrument_redis", {}),
+    (
+        "httpx",
+        "logfire__instrument__httpx",
+        "instrument_httpx",
+        {"capture_all": "logfire__httpx_capture_all"},
+    ),
+)
 
 
 def instrument_logfire() -> Dict[str, bool]:
@@ -263,49 +303,40 @@ def instrument_logfire() -> Dict[str, bool]:
     if _state.is_instrumented():
         return _state.get_instrument_results()
 
-    try:
-        # Instrument pydantic-ai
-        if settings.logfire__instrument__pydantic_ai:
-            try:
-                logfire.instrument_pydantic_ai()
-                logger.info("Logfire pydantic-ai instrumentation enabled")
-                _state.update_instrument_result("pydantic_ai", True)
-            except Exception as e:
-                logger.warning("Failed to instrument pydantic-ai with logfire: %s", e)
-
-        # Instrument Redis
-        if settings.logfire__instrument__redis:
-            try:
-                logfire.instrument_redis()
-                logger.info("Logfire Redis instrumentation enabled")
-                _state.update_instrument_result("redis", True)
-            except Exception as e:
-                logger.warning("Failed to instrument Redis with logfire: %s", e)
-
-        # Instrument HTTPX
-        if settings.logfire__instrument__httpx:
-            try:
-                capture_all = settings.logfire__httpx_capture_all
-                logfire.instrument_httpx(capture_all=capture_all)
-                logger.info(
-                    "Logfire HTTPX instrumentation enabled (capture_all=%s)",
-                    capture_all,
-                )
-                _state.update_instrument_result("httpx", True)
-            except Exception as e:
-                logger.warning("Failed to instrument HTTPX with logfire: %s", e)
-
-        _state.set_instrumented(True)
-
-    except ImportError:
-        logger.warning("Logfire not available for instrumentation")
-    except Exception as e:
-        logger.error("Failed to set up logfire instrumentation: %s", e)
+    with _state.lock:
+        if _state.is_instrumented():
+            return _state.get_instrument_results()
+
+        try:
+            import logfire
+
+            for key, enabled_field, method_name, option_fields in _LIBRARY_INSTRUMENTS:
+                if not getattr(settings, enabled_field):
+                    continue
+                options = {
+                    option: getattr(settings, field)
+                    for option, field in option_fields.items()
+                }
+                try:
+                    getattr(logfire, method_name)(**options)
+                    logger.info(
+                        "Logfire %s instrumentation enabled (options=%s)", key, options
+                    )
+                    _state.update_instrument_result(key, True)
+                except Exception as e:
+                    logger.warning("Failed to instrument %s with logfire: %s", key, e)
+
+            _state.set_instrumented(True)
+
+        except ImportError:
+            logger.warning("Logfire not available for instrumentation")
+        except Exception as e:
+            logger.error("Failed to set up logfire instrumentation: %s", e)
 
     return _state.get_instrument_results()
 
 
-def instrument_fastapi(app: FastAPI) -> bool:
+def instrument_fastapi(app: "FastAPI") -> bool:
     """
     Set up logfire instrumentation for FastAPI.
 
@@ -321,6 +352,8 @@ def instrument_fastapi(app: FastAPI) -> bool:
         return False
 
     try:
+        import logfire
+
         logfire.instrument_fastapi(
             app,
             request_attributes_mapper=custom_request_attributes_mapper,
@@ -334,7 +367,7 @@ def instrument_fastapi(app: FastAPI) -> bool:
         return False
 
 
-def initialize_logfire(app: Optional[FastAPI] = None) -> Dict[str, Any]:
+def initialize_logfire(app: Optional["FastAPI"] = None) -> Dict[str, Any]:
     """
     Complete logfire initialization including configuration and instrumentation.
 
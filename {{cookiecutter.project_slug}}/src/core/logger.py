@@ -5,13 +5,17 @@ Centralized logging configuration for AI Agents project with Logfire integration
 Based on official Logfire documentation best practices.
 """
 
+import atexit
 import logging
 import logging.config
+import queue
 import sys
+import threading
 from contextvars import ContextVar
 from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional, Tuple
 
 from src.core.config import settings
 
@@ -32,6 +36,18 @@ def _get_logfire_module() -> Any:
         return None
 
 
+@lru_cache(maxsize=1)
+def _get_otel_suppression() -> Optional[Tuple[Callable[[], Any], Any]]:
+    """Get OTel's (get_current, suppress-instrumentation key) or None if unavailable."""
+    try:
+        from opentelemetry.context import get_current
+        from opentelemetry.instrumentation.utils import _SUPPRESS_INSTRUMENTATION_KEY
+
+        return get_current, _SUPPRESS_INSTRUMENTATION_KEY
+    except ImportError:
+        return None
+
+
 def _sanitize_attributes(attrs: Dict[str, Any]) -> Dict[str, Any]:
     """Make record attributes safe for structured logging and redact sensitive keys."""
     safe: Dict[str, Any] = {}
@@ -51,6 +67,33 @@ def _sanitize_attributes(attrs: Dict[str, Any]) -> Dict[str, Any]:
     return safe
 
 
+# Standard LogRecord fields that are not forwarded to Logfire as attributes
+_EXCLUDED_LOG_ATTRS = frozenset(
+    {
+        "name",
+        "msg",
+        "args",
+        "levelname",
+        "levelno",
+        "pathname",
+        "filename",
+        "module",
+        "lineno",
+        "funcName",
+        "created",
+        "msecs",
+        "relativeCreated",
+        "thread",
+        "threadName",
+        "processName",
+        "process",
+        "getMessage",
+        "exc_info",
+        "exc_text",
+        "stack_info",
+    }
+)
+
 # Context variable to store session ID for logging
 _session_id_context: ContextVar[Optional[str]] = ContextVar("session_id", default=None)
 
@@ -70,6 +113,22 @@ def clear_session_id() -> None:
     _session_id_context.set(None)
 
 
+@lru_cache(maxsize=1024)
+def _tagged_logfire(logfire: Any, session_id: str) -> Any:
+    """Get a logfire instance tagged with the session ID, reused per session."""
+    return logfire.with_tags(f"sid:{session_id}")
+
+
+def clear_tagged_logfire_cache() -> None:
+    """
+    Drop cached session-tagged logfire instances.
+
+    Call this after logfire is (re)configured so later logs are tagged on
+    instances created from the new configuration.
+    """
+    _tagged_logfire.cache_clear()
+
+
 def get_logfire_with_session() -> Any:
     """
     Get logfire module with session ID as tag if available.
@@ -79,15 +138,16 @@ def get_logfire_with_session() -> Any:
         logfire module itself if no session,
         or None if logfire not available
     """
-    try:
-        logfire = _get_logfire_module()
-        if logfire is None:
-            return None
+    logfire = _get_logfire_module()
+    if logfire is None:
+        return None
 
-        session_id = get_session_id()
-        if session_id:
-            return logfire.with_tags(f"sid:{session_id}")
+    session_id = _session_id_context.get()
+    if not session_id:
         return logfire
+
+    try:
+        return _tagged_logfire(logfire, session_id)
     except (AttributeError, TypeError):
         return None
 
@@ -126,77 +186,38 @@ class SessionAwareLogfireHandler(logging.Handler):
             return
 
         # Check if instrumentation is suppressed (best-effort)
-        try:
-            from opentelemetry.context import get_current
-            from opentelemetry.instrumentation.utils import (
-                _SUPPRESS_INSTRUMENTATION_KEY,
-            )
-
-            ctx = get_current()
-            # Try different Context API methods for version compatibility
-            try:
-                # Modern OTel versions use .get() method
-                if ctx.get(_SUPPRESS_INSTRUMENTATION_KEY, False):
-                    self.fallback.emit(record)
-                    return
-            except AttributeError:
-                try:
-                    # Older OTel versions use .get_value() method
-                    if ctx.get_value(_SUPPRESS_INSTRUMENTATION_KEY):
-                        self.fallback.emit(record)
-                        return
-                except (AttributeError, TypeError, KeyError):
-                    # If both methods fail, continue with logging
-                    pass
-        except ImportError:
-            # OpenTelemetry not available, continue with logging
-            pass
+        otel = _get_otel_suppression()
+        if otel is not None:
+            get_current, suppress_key = otel
+            if get_current().get(suppress_key, False):
+                self.fallback.emit(record)
+                return
 
         try:
             # Get session ID and create appropriate logfire instance
-            session_id = get_session_id()
+            session_id = _session_id_context.get()
             if session_id:
                 # Only create logfire instance with session tag if session ID exists
-                logfire_with_session = logfire.with_tags(f"sid:{session_id}")
+                logfire_with_session = _tagged_logfire(logfire, session_id)
             else:
                 # Use default logfire instance without any session tags
                 logfire_with_session = self.logfire_instance or logfire
 
             # Prepare attributes from log record
+            record_dict = record.__dict__
             raw_attrs = {
-                k: v
-                for k, v in record.__dict__.items()
-                if k
-                not in [
-                    "name",
-                    "msg",
-                    "args",
-                    "levelname",
-                    "levelno",
-                    "pathname",
-                    "filename",
-                    "module",
-                    "lineno",
-                    "funcName",
-                    "created",
-                    "msecs",
-                    "relativeCreated",
-                    "thread",
-                    "threadName",
-                    "processName",
-                    "process",
-                    "getMessage",
-                    "exc_info",
-                    "exc_text",
-                    "stack_info",
-                ]
+                k: record_dict[k] for k in record_dict.keys() - _EXCLUDED_LOG_ATTRS
             }
             attributes = _sanitize_attributes(raw_attrs)
 
             # Add code location attributes
-            attributes["code.filepath"] = record.pathname
-            attributes["code.lineno"] = record.lineno
-            attributes["code.function"] = record.funcName
+            attributes.update(
+                (
+                    ("code.filepath", record.pathname),
+                    ("code.lineno", record.lineno),
+                    ("code.function", record.funcName),
+                )
+            )
 
             # Format the message
             try:
@@ -222,7 +243,7 @@ class SessionAwareLogfireHandler(logging.Handler):
 
 def get_logging_config() -> Dict[str, Any]:
     """
-    Generate base logging configuration (console + file).
+    Generate base logging configuration (console, plus file unless disabled).
     Logfire handler must be added separately via setup_logfire_handler().
 
     Returns:
@@ -232,24 +253,27 @@ def get_logging_config() -> Dict[str, Any]:
     # Determine log level
     log_level = (_get_setting("log_level", "info") or "info").upper()
 
-    # Create logs directory for fallback (configurable)
-    logs_dir = Path(_get_setting("log__dir", "logs"))
-    logs_dir.mkdir(exist_ok=True)
-
-    # Determine file path - use custom path if provided, otherwise use dir + default filename
-    file_path = _get_setting("log__file_path", None)
-    if file_path is None:
-        file_path = str(logs_dir / "{{cookiecutter.project_slug}}.log")
-
-    # Base handlers - always include console and file for fallback
-    handlers = {
+    # Base handlers - console always, rotating file when enabled
+    handlers: Dict[str, Dict[str, Any]] = {
         "console": {
             "class": "logging.StreamHandler",
             "level": log_level,
             "formatter": "simple",
             "stream": sys.stdout,
         },
-        "file": {
+    }
+
+    if _get_setting("log__file_enabled", True):
+        # Create logs directory for fallback (configurable)
+        logs_dir = Path(_get_setting("log__dir", "logs"))
+        logs_dir.mkdir(exist_ok=True)
+
+        # Determine file path - custom path if provided, otherwise dir + default name
+        file_path = _get_setting("log__file_path", None)
+        if file_path is None:
+            file_path = str(logs_dir / "{{cookiecutter.project_slug}}.log")
+
+        handlers["file"] = {
             "class": "logging.handlers.RotatingFileHandler",
             "level": _get_setting("log__file_level", "INFO"),
             "formatter": "detailed",
@@ -257,8 +281,7 @@ def get_logging_config() -> Dict[str, Any]:
             "maxBytes": int(_get_setting("log__file_max_bytes", 10 * 1024 * 1024)),
             "backupCount": int(_get_setting("log__file_backup_count", 3)),
             "encoding": "utf-8",
-        },
-    }
+        }
 
     # Base configuration
     # Note: Logfire handler is added separately via setup_logfire_handler()
@@ -283,7 +306,7 @@ def get_logging_config() -> Dict[str, Any]:
             # {{cookiecutter.project_name}} application loggers
             "{{cookiecutter.project_slug}}": {
                 "level": log_level,
-                "handlers": ["console", "file"],
+                "handlers": list(handlers),
                 "propagate": False,
             },
             # Third-party library loggers - reduce verbosity but keep important logs
@@ -297,6 +320,16 @@ def get_logging_config() -> Dict[str, Any]:
     return config
 
 
+class _ExcludeUrllib3Filter(logging.Filter):
+    """Drop records emitted by urllib3 loggers."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return not record.name.startswith("urllib3")
+
+
+_EXCLUDE_URLLIB3 = _ExcludeUrllib3Filter()
+
+
 def setup_logfire_handler() -> None:
     """
     Set up Logfire handler after logfire.configure() has been called.
@@ -328,7 +361,7 @@ def setup_logfire_handler() -> None:
         )
 
         # Filter out urllib3 debug logs from fallback handler
-        fallback_handler.addFilter(lambda record: not record.name.startswith("urllib3"))
+        fallback_handler.addFilter(_EXCLUDE_URLLIB3)
 
         # Create our custom session-aware Logfire handler
         logfire_handler = SessionAwareLogfireHandler(
@@ -337,7 +370,10 @@ def setup_logfire_handler() -> None:
             logfire_instance=logfire,
         )
 
-        # Add Logfire handler to the agent logger
+        # Add Logfire handler to the agent logger. It stays on the caller's
+        # thread so records keep the active OpenTelemetry context (parent span,
+        # trace id, instrumentation suppression); Logfire's exporter already
+        # batches network I/O on its own thread.
         agent_logger.addHandler(logfire_handler)
 
         # Log successful Logfire integration
@@ -345,24 +381,103 @@ def setup_logfire_handler() -> None:
         logger.info("Session-aware Logfire logging handler configured successfully")
 
     except ImportError:
-        # Use print instead of logger since logging might not be fully configured
-        print("⚠️  Logfire not available, using standard logging only")
+        # Warnings still reach stderr via logging.lastResort if not yet configured
+        logging.getLogger("{{cookiecutter.project_slug}}.logfire").warning(
+            "Logfire not available, using standard logging only"
+        )
     except (AttributeError, TypeError, ValueError) as e:
-        # Use print instead of logger since logging might not be fully configured
-        print(f"⚠️  Failed to configure Logfire handler: {e}")
+        logging.getLogger("{{cookiecutter.project_slug}}.logfire").warning(
+            "Failed to configure Logfire handler: %s", e
+        )
 
 
+# Background listener that owns the real console/file handlers
+_queue_listener: Optional[QueueListener] = None
+
+
+def _install_queue_listener() -> None:
+    """
+    Move the application logger's handlers behind a QueueListener.
+
+    Callers only enqueue records; formatting and stream/file I/O happen on
+    the listener's background thread. The Logfire handler is left on the
+    logger because it needs the caller's OpenTelemetry context. The listener
+    is stopped at interpreter exit so queued records are flushed.
+    """
+    global _queue_listener
+
+    if _queue_listener is not None:
+        return
+
+    agent_logger = logging.getLogger("{{cookiecutter.project_slug}}")
+    handlers = [
+        h
+        for h in agent_logger.handlers
+        if not isinstance(h, SessionAwareLogfireHandler)
+    ]
+    if not handlers:
+        return
+
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    for handler in handlers:
+        agent_logger.removeHandler(handler)
+    agent_logger.addHandler(QueueHandler(log_queue))
+
+    _queue_listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _queue_listener.start()
+    atexit.register(stop_logging_listener)
+
+
+def stop_logging_listener() -> None:
+    """
+    Flush pending log records and stop the background logging listener.
+
+    Should be called during application shutdown. The real handlers are put
+    back on the application logger, so later records are still written.
+    """
+    global _queue_listener
+
+    listener = _queue_listener
+    if listener is None:
+        return
+    _queue_listener = None
+    listener.stop()
+
+    agent_logger = logging.getLogger("{{cookiecutter.project_slug}}")
+    for handler in list(agent_logger.handlers):
+        if isinstance(handler, QueueHandler):
+            agent_logger.removeHandler(handler)
+    for handler in listener.handlers:
+        agent_logger.addHandler(handler)
+
+
+# Run-once guard for setup_logging(); get_logger() checks the flag lock-free
+_logging_configured = False
+_logging_configure_lock = threading.Lock()
+
 
-@lru_cache(maxsize=1)
 def setup_logging() -> None:
     """
     Set up base logging configuration (console + file handlers).
     Logfire handler must be set up separately via setup_logfire_handler().
-    This function should be called once during application startup.
+    This function is idempotent - only the first call configures logging.
     """
+    global _logging_configured
+
+    if _logging_configured:
+        return
 
-    config = get_logging_config()
-    logging.config.dictConfig(config)
+    with _logging_configure_lock:
+        if _logging_configured:
+            return  # type: ignore[unreachable]
+
+        config = get_logging_config()
+        logging.config.dictConfig(config)
+
+        # Hand console/file I/O off to a background thread
+        _install_queue_listener()
+
+        _logging_configured = True
 
     # Log startup information
     logger = logging.getLogger("{{cookiecutter.project_slug}}.startup")
@@ -374,10 +489,13 @@ def setup_logging() -> None:
     )
 
 
+@lru_cache(maxsize=None)
 def get_logger(name: str) -> logging.Logger:
     """
     Get a logger instance with automatic '{{cookiecutter.project_slug}}' prefix.
 
+    Results are cached per name, so repeated calls are a single dict lookup.
+
     Args:
         name: Logger name, typically __name__ of the calling module.
               Will be prefixed with '{{cookiecutter.project_slug}}.' if not already present.
@@ -391,7 +509,8 @@ def get_logger(name: str) -> logging.Logger:
     """
 
     # Ensure logging is set up
-    setup_logging()
+    if not _logging_configured:
+        setup_logging()
 
     # Get logger with {{cookiecutter.project_slug}} prefix if not already present
     if not name.startswith("{{cookiecutter.project_slug}}"):
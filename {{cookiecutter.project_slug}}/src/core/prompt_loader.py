@@ -4,29 +4,89 @@ Prompt Loader Utility
 This module provides a utility for loading prompt text from files
 in the `prompts` directory.
 
-The loader uses LRU caching (maxsize=128) to improve performance by avoiding
-repeated file I/O operations. Use clear_prompt_cache() to manually clear the
-cache when prompt files are updated during runtime.
+All prompt files are read into memory once at import, so load_prompt() is a
+dictionary lookup on the request path. Prompts added after startup are read
+from disk on each use until clear_prompt_cache() reloads the prompts, which
+should be called when files are updated during runtime.
 """
 
-from functools import lru_cache
+import os
 from pathlib import Path
+from typing import Dict
 
 from src.core.error_codes import InternalServiceErrorCode
 from src.core.exceptions import InternalServiceException
+from src.core.logger import get_logger
+
+logger = get_logger(__name__)
 
 # Get the absolute path to the 'prompts' directory
 # This makes the loader independent of where the script is run
 PROMPT_DIR = Path(__file__).resolve().parent.parent / "prompts"
 
+# Files in the prompts package that are not prompts
+_NON_PROMPT_SUFFIXES = frozenset({".py", ".pyc"})
 
-@lru_cache(maxsize=128)
-def load_prompt(prompt_name: str, **kwargs) -> str:
+
+def _read_file(path: Path) -> str:
     """
-    Load a prompt from the 'prompts' directory.
+    Read a UTF-8 file from a raw file descriptor.
+
+    The read is sized from fstat plus one byte, so an unchanged file takes a
+    single read call; the extra byte detects a file that grew since fstat.
 
     Args:
-        prompt_name (str): The filename of the prompt (e.g., 'resume_parser.txt')
+        path (Path): File to read
+
+    Returns:
+        str: The decoded file content
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        chunks = [os.read(fd, size + 1)]
+        if len(chunks[0]) > size:
+            # The file grew after fstat; read the rest
+            while chunks[-1]:
+                chunks.append(os.read(fd, 4096))
+    finally:
+        os.close(fd)
+    return b"".join(chunks).decode("utf-8")
+
+
+def _preload_prompts() -> Dict[str, str]:
+    """
+    Read every prompt file under the prompts directory.
+
+    Files that cannot be read or decoded are logged and skipped, so they do
+    not break import; load_prompt() reports the error when they are used.
+
+    Returns:
+        Dict[str, str]: Prompt content keyed by path relative to PROMPT_DIR
+    """
+    prompts: Dict[str, str] = {}
+    for path in PROMPT_DIR.rglob("*"):
+        if not path.is_file() or path.suffix in _NON_PROMPT_SUFFIXES:
+            continue
+        name = path.relative_to(PROMPT_DIR).as_posix()
+        try:
+            prompts[name] = _read_file(path)
+        except (OSError, UnicodeDecodeError) as e:
+            logger.warning("Skipping unreadable prompt file %s: %s", name, e)
+    return prompts
+
+
+_PROMPTS: Dict[str, str] = _preload_prompts()
+
+
+def _read_prompt(prompt_name: str) -> str:
+    """
+    Read a prompt that was not preloaded.
+
+    The result is not cached, so lookups of arbitrary names cannot grow memory.
+
+    Args:
+        prompt_name (str): The filename of the prompt
 
     Returns:
         str: The content of the prompt file.
@@ -34,12 +94,11 @@ def load_prompt(prompt_name: str, **kwargs) -> str:
     Raises:
         InternalServiceException: If the prompt file is not found or cannot be read.
     """
-    # Resolve paths and validate against directory traversal
-    base_dir = PROMPT_DIR.resolve()
-    target_path = (base_dir / prompt_name).resolve()
+    # Resolve the target and validate against directory traversal
+    target_path = (PROMPT_DIR / prompt_name).resolve()
 
     # Security check: ensure target path is within the prompts directory
-    if not str(target_path).startswith(str(base_dir)):
+    if not target_path.is_relative_to(PROMPT_DIR):
         raise InternalServiceException(
             "Invalid prompt path outside prompts directory",
             InternalServiceErrorCode.OPERATION_FAILED,
@@ -47,14 +106,7 @@ def load_prompt(prompt_name: str, **kwargs) -> str:
         )
 
     try:
-        prompt_content = target_path.read_text(encoding="utf-8")
-        
-        # Replace placeholders with provided kwargs
-        for key, value in kwargs.items():
-            placeholder = "{" + key + "}"
-            prompt_content = prompt_content.replace(placeholder, str(value))
-        
-        return prompt_content
+        prompt_content = _read_file(target_path)
     except FileNotFoundError as exc:
         raise InternalServiceException(
             f"Prompt file not found at: {target_path}",
@@ -70,12 +122,41 @@ def load_prompt(prompt_name: str, **kwargs) -> str:
             file_path=str(target_path),
         )
 
+    return prompt_content
+
+
+def load_prompt(prompt_name: str, **kwargs) -> str:
+    """
+    Load a prompt from the 'prompts' directory.
+
+    Args:
+        prompt_name (str): The filename of the prompt (e.g., 'resume_parser.txt')
+        **kwargs: Values substituted for ``{name}`` placeholders in the prompt
+
+    Returns:
+        str: The content of the prompt file.
+
+    Raises:
+        InternalServiceException: If the prompt file is not found or cannot be read.
+    """
+    prompt_content = _PROMPTS.get(prompt_name)
+    if prompt_content is None:
+        prompt_content = _read_prompt(prompt_name)
+
+    # Replace placeholders with provided kwargs
+    for key, value in kwargs.items():
+        placeholder = "{" + key + "}"
+        prompt_content = prompt_content.replace(placeholder, str(value))
+
+    return prompt_content
+
 
 def clear_prompt_cache() -> None:
     """
-    Clear the prompt loading cache.
+    Reload all prompts from the prompts directory.
 
     This function should be called when prompt files are updated during runtime
     to ensure the latest content is loaded on subsequent calls to load_prompt().
     """
-    load_prompt.cache_clear()
+    _PROMPTS.clear()
+    _PROMPTS.update(_preload_prompts())
@@ -12,11 +12,18 @@ cause immediate import errors rather than graceful degradation.
 from .database import (
     Base,
     SessionLocal,
+    async_database_session,
+    async_stream_query,
+    async_transaction_manager,
     database_session,
+    dispose_async_engine,
     dispose_engine,
     engine,
+    get_async_db_dependency,
+    get_async_engine,
     get_db_dependency,
     get_pool_status,
+    stream_query,
     test_connection,
     transaction_manager,
 )
@@ -29,7 +36,7 @@ from .redis_client import (
     get_redis_client_async,
     test_redis_connection,
 )
-from .redis_lock import SessionLock, session_lock_context
+from .redis_lock import SessionLock, close_lock_listener, session_lock_context
 
 # Stores package exports - only components from this package
 __all__ = [
@@ -40,9 +47,16 @@ __all__ = [
     "get_db_dependency",
     "database_session",
     "transaction_manager",
+    "stream_query",
     "test_connection",
     "get_pool_status",
     "dispose_engine",
+    "get_async_engine",
+    "get_async_db_dependency",
+    "async_database_session",
+    "async_transaction_manager",
+    "async_stream_query",
+    "dispose_async_engine",
     # Redis
     "RedisClient",
     "get_redis_client",
@@ -52,4 +66,5 @@ __all__ = [
     # Redis Lock
     "SessionLock",
     "session_lock_context",
+    "close_lock_listener",
 ]
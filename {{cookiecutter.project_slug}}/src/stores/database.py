@@ -8,23 +8,42 @@ Features:
 - Connection pool with monitoring and health checks
 - Transaction context managers with automatic rollback
 - FastAPI-compatible dependency injection
+- Optional asyncpg engine and AsyncSession helpers for non-blocking I/O
 - Comprehensive error handling with core error codes
 - Connection lifecycle management
 """
 
-from contextlib import contextmanager
+from contextlib import asynccontextmanager, contextmanager
 from dataclasses import dataclass
-from typing import Any, Dict, Generator
+from functools import lru_cache
+from typing import (
+    Any,
+    AsyncGenerator,
+    AsyncIterator,
+    Dict,
+    Generator,
+    Iterator,
+    Optional,
+    Type,
+)
+from uuid import uuid4
 
-from sqlalchemy import Engine, create_engine, text
+from sqlalchemy import URL, Engine, create_engine, make_url, text
 from sqlalchemy.exc import (
     DatabaseError,
     InterfaceError,
     OperationalError,
     SQLAlchemyError,
 )
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import Session, declarative_base, sessionmaker
-from sqlalchemy.pool import QueuePool
+from sqlalchemy.pool import NullPool, Pool, QueuePool
+from sqlalchemy.sql import Executable
 
 # Fast-failing imports from core
 from src.core.config import settings
@@ -35,7 +54,7 @@ from src.core.logger import get_logger
 logger = get_logger(__name__)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PoolStatus:
     """Immutable connection pool status information."""
 
@@ -44,23 +63,76 @@ class PoolStatus:
     overflow: int
 
 
+# Reported for pools without QueuePool counters
+_EMPTY_POOL_STATUS = PoolStatus(size=0, checked_out=0, overflow=0)
+
 # Global SQLAlchemy base
 Base = declarative_base()
 
 
+# libpq TCP keepalive parameters for psycopg2 connections
+_LIBPQ_KEEPALIVE_ARGS: Dict[str, int] = {
+    "keepalives": 1,
+    "keepalives_idle": 30,
+    "keepalives_interval": 10,
+    "keepalives_count": 5,
+}
+
+
+def _pool_reset_on_return() -> Optional[str]:
+    """Map database__pool_reset_on_return to SQLAlchemy's value ('none' -> None)."""
+    reset = settings.database__pool_reset_on_return
+    return None if reset == "none" else reset
+
+
+def _pool_kwargs(poolclass: Optional[Type[Pool]] = None) -> Dict[str, Any]:
+    """
+    Build the pool arguments for create_engine / create_async_engine.
+
+    With database__use_nullpool, connections are opened per checkout and pooling
+    is left to an external pooler such as PgBouncer; NullPool rejects sizing
+    arguments, so only the pool class is returned.
+
+    Args:
+        poolclass: Pool class for the pooled case, or None for the engine default
+
+    Returns:
+        Dict[str, Any]: Keyword arguments for the engine factory
+    """
+    if settings.database__use_nullpool:
+        return {"poolclass": NullPool}
+
+    kwargs: Dict[str, Any] = {
+        "pool_size": settings.database__pool_size,
+        "max_overflow": settings.database__max_overflow,
+        "pool_timeout": settings.database__pool_timeout,
+    }
+    if poolclass is not None:
+        kwargs["poolclass"] = poolclass
+    return kwargs
+
+
 def _create_database_engine() -> Engine:
     """Create and configure the database engine with optimized settings."""
     try:
+        # psycopg2 batches executemany() for INSERT only by default; also page
+        # UPDATE/DELETE batches through execute_batch to cut round-trips
+        driver_kwargs: Dict[str, Any] = {}
+        if make_url(settings.database__url).get_driver_name() == "psycopg2":
+            driver_kwargs["executemany_mode"] = "values_plus_batch"
+            # Kernel TCP keepalives detect dead connections without the
+            # per-checkout SELECT 1 that pool_pre_ping issues
+            driver_kwargs["connect_args"] = _LIBPQ_KEEPALIVE_ARGS
+
         db_engine = create_engine(
             settings.database__url,
             echo=settings.database__echo,
             # Use all configurable database settings
             pool_pre_ping=settings.database__pool_pre_ping,
-            pool_size=settings.database__pool_size,
-            max_overflow=settings.database__max_overflow,
-            pool_timeout=settings.database__pool_timeout,
             pool_recycle=settings.database__pool_recycle,
-            poolclass=QueuePool,
+            pool_reset_on_return=_pool_reset_on_return(),
+            **_pool_kwargs(QueuePool),
+            **driver_kwargs,
         )
 
         return db_engine
@@ -107,12 +179,14 @@ def get_pool_status() -> PoolStatus:
         DatabaseException: If pool status cannot be retrieved
     """
     try:
+        # Read engine.pool on each call: dispose() replaces the pool object
         pool = engine.pool
-        # QueuePool specific attributes - use getattr with defaults for safety
+        if not isinstance(pool, QueuePool):
+            return _EMPTY_POOL_STATUS
         return PoolStatus(
-            size=getattr(pool, "size", lambda: 0)(),
-            checked_out=getattr(pool, "checkedout", lambda: 0)(),
-            overflow=getattr(pool, "overflow", lambda: 0)(),
+            size=pool.size(),
+            checked_out=pool.checkedout(),
+            overflow=pool.overflow(),
         )
     except Exception as e:
         logger.error("Failed to get pool status: %s", str(e))
@@ -288,6 +362,12 @@ def transaction_manager(db_session: Session) -> Generator[Session, None, None]:
             logger.debug("Database transaction rolled back")
         except Exception as rollback_error:
             logger.error("Failed to rollback transaction: %s", str(rollback_error))
+            # Connection state is unknown; make the pool discard it on checkin.
+            # The session itself is closed by whoever created it.
+            try:
+                db_session.invalidate()
+            except Exception:
+                pass
 
         # 根据异常类型选择错误码
         error_code = (
@@ -301,6 +381,295 @@ def transaction_manager(db_session: Session) -> Generator[Session, None, None]:
         ) from e
 
 
+def stream_query(
+    db_session: Session, statement: Executable, batch_size: int = 1000
+) -> Iterator[Any]:
+    """
+    Iterate over a query's results in batches instead of loading them all.
+
+    Uses yield_per, which on PostgreSQL streams rows from a server-side cursor
+    so memory stays bounded by the batch size.
+
+    Args:
+        db_session: Existing database session
+        statement: Select statement to execute
+        batch_size: Number of rows fetched per batch
+
+    Yields:
+        Result rows as scalars (first column of each row)
+
+    Example:
+        with database_session() as db:
+            for user in stream_query(db, select(User)):
+                process(user)
+    """
+    result = db_session.execute(statement.execution_options(yield_per=batch_size))
+    yield from result.scalars()
+
+
+# Async engine and sessions (asyncpg)
+#
+# Created on first use so processes that only use the sync engine do not open
+# a second pool. The async path uses the same database__* settings, with the
+# PostgreSQL driver switched to asyncpg.
+
+
+def _async_database_url() -> URL:
+    """Return settings.database__url with the asyncpg driver for PostgreSQL."""
+    url = make_url(settings.database__url)
+    if url.get_backend_name() == "postgresql":
+        url = url.set(drivername="postgresql+asyncpg")
+    return url
+
+
+def _unique_prepared_statement_name() -> str:
+    """Return a prepared statement name that is unique across connections."""
+    return f"__asyncpg_{uuid4()}__"
+
+
+@lru_cache(maxsize=1)
+def get_async_engine() -> AsyncEngine:
+    """
+    Get the async database engine, creating it on first call.
+
+    Returns:
+        AsyncEngine: SQLAlchemy async engine
+
+    Raises:
+        DatabaseException: If engine creation fails
+    """
+    url = _async_database_url()
+    async_kwargs: Dict[str, Any] = {}
+    if settings.database__use_nullpool and url.get_driver_name() == "asyncpg":
+        # PgBouncer in transaction mode may run each statement on a different
+        # server connection. Disable both asyncpg's statement cache and
+        # SQLAlchemy's adapter cache, and give the prepared statements that
+        # asyncpg still creates unique names so they never collide across
+        # clients sharing a server connection.
+        url = url.update_query_dict({"prepared_statement_cache_size": "0"})
+        async_kwargs["connect_args"] = {
+            "statement_cache_size": 0,
+            "prepared_statement_name_func": _unique_prepared_statement_name,
+        }
+
+    try:
+        return create_async_engine(
+            url,
+            echo=settings.database__echo,
+            # asyncpg gets no TCP keepalive arguments, so always detect dead
+            # connections on checkout
+            pool_pre_ping=True,
+            pool_recycle=settings.database__pool_recycle,
+            pool_reset_on_return=_pool_reset_on_return(),
+            **_pool_kwargs(),
+            **async_kwargs,
+        )
+    except Exception as e:
+        logger.error("Failed to create async database engine: %s", str(e))
+        raise DatabaseException(
+            DatabaseErrorCode.CONNECTION_FAILED,
+            f"Async database engine creation failed: {str(e)}",
+        ) from e
+
+
+@lru_cache(maxsize=1)
+def _get_async_session_factory() -> async_sessionmaker[AsyncSession]:
+    """Get the async session factory bound to the async engine."""
+    # expire_on_commit=False: expired attributes cannot be lazily refreshed
+    # outside an await, so objects stay readable after commit
+    return async_sessionmaker(
+        bind=get_async_engine(),
+        autoflush=False,
+        expire_on_commit=False,
+    )
+
+
+async def _create_async_db_session() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Internal async session creation logic with unified error handling.
+
+    Mirrors _create_db_session for AsyncSession.
+
+    Yields:
+        AsyncSession: SQLAlchemy async database session
+
+    Raises:
+        DatabaseException: If session creation or management fails
+    """
+    db_session = None
+    try:
+        db_session = _get_async_session_factory()()
+        logger.debug("Async database session created")
+        yield db_session
+
+    except SQLAlchemyError as e:
+        logger.error("Async database session error: %s", str(e))
+        if db_session:
+            try:
+                await db_session.rollback()
+                logger.debug("Async database session rolled back due to error")
+            except Exception as rollback_error:
+                logger.error("Failed to rollback session: %s", str(rollback_error))
+        raise DatabaseException(
+            DatabaseErrorCode.QUERY_FAILED, f"Database session error: {str(e)}"
+        ) from e
+
+    except Exception as e:
+        logger.error("Unexpected async session error: %s", str(e))
+        if db_session:
+            try:
+                await db_session.rollback()
+            except Exception:
+                pass
+        raise
+
+    finally:
+        if db_session:
+            try:
+                await db_session.close()
+                logger.debug("Async database session closed")
+            except Exception as close_error:
+                logger.error("Failed to close database session: %s", str(close_error))
+
+
+async def get_async_db_dependency() -> AsyncGenerator[AsyncSession, None]:
+    """
+    FastAPI dependency for an async database session.
+
+    Database I/O is awaited instead of blocking the event loop.
+
+    Yields:
+        AsyncSession: SQLAlchemy async database session
+
+    Example:
+        @app.get("/users")
+        async def get_users(db: AsyncSession = Depends(get_async_db_dependency)):
+            result = await db.execute(select(User))
+            return result.scalars().all()
+    """
+    async for db_session in _create_async_db_session():
+        yield db_session
+
+
+@asynccontextmanager
+async def async_database_session() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Async context manager for database session.
+
+    Use this for async services and background tasks outside FastAPI routes.
+
+    Yields:
+        AsyncSession: SQLAlchemy async database session
+
+    Example:
+        async with async_database_session() as db:
+            user = await db.get(User, user_id)
+    """
+    async for db_session in _create_async_db_session():
+        yield db_session
+
+
+@asynccontextmanager
+async def async_transaction_manager(
+    db_session: AsyncSession,
+) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Async transaction context manager with automatic commit/rollback.
+
+    Async counterpart of transaction_manager.
+
+    Args:
+        db_session: Existing async database session
+
+    Yields:
+        AsyncSession: The same database session within transaction context
+
+    Raises:
+        DatabaseException: If transaction fails
+
+    Usage:
+        async with async_database_session() as db:
+            async with async_transaction_manager(db) as tx:
+                tx.add(User(name="John"))
+                await tx.flush()
+    """
+    if db_session is None:
+        raise DatabaseException(
+            DatabaseErrorCode.CONNECTION_FAILED, "Database session is None"
+        )
+
+    logger.debug("Starting async database transaction")
+
+    try:
+        yield db_session
+        await db_session.commit()
+        logger.debug("Async database transaction committed successfully")
+
+    except Exception as e:
+        logger.error("Async database transaction failed: %s", str(e))
+        try:
+            await db_session.rollback()
+            logger.debug("Async database transaction rolled back")
+        except Exception as rollback_error:
+            logger.error("Failed to rollback transaction: %s", str(rollback_error))
+            # Connection state is unknown; make the pool discard it on checkin
+            try:
+                await db_session.invalidate()
+            except Exception:
+                pass
+
+        error_code = (
+            DatabaseErrorCode.QUERY_FAILED
+            if isinstance(e, SQLAlchemyError)
+            else DatabaseErrorCode.TRANSACTION_FAILED
+        )
+
+        raise DatabaseException(
+            error_code, f"Database transaction failed: {str(e)}"
+        ) from e
+
+
+async def async_stream_query(
+    db_session: AsyncSession, statement: Executable, batch_size: int = 1000
+) -> AsyncIterator[Any]:
+    """
+    Async counterpart of stream_query using an asyncpg server-side cursor.
+
+    Args:
+        db_session: Existing async database session
+        statement: Select statement to execute
+        batch_size: Number of rows fetched per batch
+
+    Yields:
+        Result rows as scalars (first column of each row)
+
+    Example:
+        async with async_database_session() as db:
+            async for user in async_stream_query(db, select(User)):
+                await process(user)
+    """
+    result = await db_session.stream_scalars(
+        statement.execution_options(yield_per=batch_size)
+    )
+    async for row in result:
+        yield row
+
+
+async def dispose_async_engine() -> None:
+    """
+    Dispose the async database engine if it was created.
+
+    Should be called during application shutdown alongside dispose_engine().
+    """
+    if get_async_engine.cache_info().currsize == 0:
+        return
+    try:
+        await get_async_engine().dispose()
+        logger.info("Async database engine disposed successfully")
+    except Exception as e:
+        logger.error("Failed to dispose async database engine: %s", str(e))
+
+
 def dispose_engine() -> None:
     """
     Dispose database engine and close all connections.
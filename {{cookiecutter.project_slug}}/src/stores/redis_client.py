@@ -5,15 +5,27 @@ Redis connection management and basic operations for AI Agents project.
 """
 
 import asyncio
-import json
+import random
+import secrets
 import time
-import uuid
 from contextlib import asynccontextmanager
-from typing import Any, AsyncGenerator, Dict, List, Optional
+from typing import (
+    Any,
+    AsyncGenerator,
+    AsyncIterator,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 from urllib.parse import quote
 
+import orjson
 import redis.asyncio as redis
 from redis.asyncio import ConnectionPool
+from redis.asyncio.client import PubSub
+from redis.commands.core import AsyncScript
 
 # Fast-failing imports from core
 from src.core.config import settings
@@ -23,6 +35,18 @@ from src.core.logger import get_logger
 
 logger = get_logger(__name__)
 
+# First lock retry delay in seconds; doubles up to redis_lock__retry_sleep_interval
+_LOCK_RETRY_INITIAL_DELAY = 0.005
+
+# Lua script to ensure atomic check-and-delete on lock release
+_RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+else
+    return 0
+end
+"""
+
 
 class RedisClient:
     """
@@ -33,12 +57,58 @@ class RedisClient:
         """Initialize Redis client with connection pool."""
         self._pool: Optional[ConnectionPool] = None
         self._client: Optional[redis.Redis] = None
-        self._lock = asyncio.Lock()
+        self._release_script: Optional[AsyncScript] = None
+        # Created on first async use, inside the event loop that will await it
+        self._lock: Optional[asyncio.Lock] = None
+        # Resolved once so (re)connecting under the lock only opens the pool
+        self._redis_url, self._pool_kwargs = self._build_connection_config()
+
+    @staticmethod
+    def _build_connection_config() -> Tuple[str, Dict[str, Any]]:
+        """
+        Build the Redis URL and connection pool options from settings.
+
+        Returns:
+            Tuple of connection URL and ConnectionPool.from_url keyword arguments
+        """
+        # Build Redis connection URL from settings with proper password encoding
+        password = settings.redis__password
+        auth = f":{quote(password)}@" if password else ""
+        unix_socket_path = settings.redis__unix_socket_path
+        if unix_socket_path:
+            # Colocated Redis: skip the TCP/IP stack entirely
+            redis_url = f"unix://{auth}{unix_socket_path}?db={settings.redis__db}"
+        else:
+            scheme = "rediss" if settings.redis__ssl else "redis"
+            redis_url = (
+                f"{scheme}://{auth}{settings.redis__host}:"
+                f"{settings.redis__port}/{settings.redis__db}"
+            )
+
+        # Create connection pool with settings (only use defined config items)
+        pool_kwargs: Dict[str, Any] = {
+            "encoding": "utf-8",
+            "decode_responses": True,
+            "retry_on_timeout": True,
+            "socket_connect_timeout": settings.redis__connect_timeout,
+            "socket_timeout": settings.redis__socket_timeout,
+        }
+
+        # Add SSL configuration if enabled
+        if settings.redis__ssl and not unix_socket_path:
+            pool_kwargs["connection_class"] = redis.SSLConnection
+            pool_kwargs["ssl_check_hostname"] = False
+            pool_kwargs["ssl_cert_reqs"] = None
+
+        return redis_url, pool_kwargs
 
     async def _ensure_connection(self) -> redis.Redis:
         """
         Ensure Redis connection is established.
 
+        Operations read ``self._client`` first and only await this method while
+        it is None, so connected calls skip the extra coroutine.
+
         Returns:
             redis.Redis: Redis client instance
 
@@ -48,43 +118,26 @@ class RedisClient:
         if self._client is not None:
             return self._client
 
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
         async with self._lock:
             if self._client is not None:
                 return self._client  # type: ignore[unreachable]
 
             try:
-                # Build Redis connection URL from settings with proper password encoding
-                scheme = "rediss" if settings.redis__ssl else "redis"
-                auth = (
-                    f":{quote(settings.redis__password)}@"
-                    if settings.redis__password
-                    else ""
-                )
-                redis_url = (
-                    f"{scheme}://{auth}{settings.redis__host}:"
-                    f"{settings.redis__port}/{settings.redis__db}"
+                self._pool = ConnectionPool.from_url(
+                    self._redis_url, **self._pool_kwargs
                 )
 
-                # Create connection pool with settings (only use defined config items)
-                pool_kwargs = {
-                    "encoding": "utf-8",
-                    "decode_responses": True,
-                    "retry_on_timeout": True,
-                    "socket_connect_timeout": settings.redis__connect_timeout,
-                    "socket_timeout": settings.redis__socket_timeout,
-                }
-
-                # Add SSL configuration if enabled
-                if settings.redis__ssl:
-                    pool_kwargs["connection_class"] = redis.SSLConnection
-                    pool_kwargs["ssl_check_hostname"] = False
-                    pool_kwargs["ssl_cert_reqs"] = None
-
-                self._pool = ConnectionPool.from_url(redis_url, **pool_kwargs)
-
                 # Create Redis client
                 self._client = redis.Redis(connection_pool=self._pool)
 
+                # Runs via EVALSHA; redis-py reloads the script on NOSCRIPT
+                self._release_script = self._client.register_script(
+                    _RELEASE_LOCK_SCRIPT
+                )
+
                 # Test connection
                 await self._client.ping()
                 logger.info("Redis connection established successfully")
@@ -103,6 +156,7 @@ class RedisClient:
         if self._client:
             await self._client.aclose()
             self._client = None
+            self._release_script = None
         if self._pool:
             await self._pool.disconnect()
             self._pool = None
@@ -119,7 +173,7 @@ class RedisClient:
         Returns:
             Value or None if key doesn't exist
         """
-        client = await self._ensure_connection()
+        client = self._client or await self._ensure_connection()
         result = await client.get(key)
         return str(result) if result is not None else None
 
@@ -138,7 +192,7 @@ class RedisClient:
         Returns:
             True if successful, False otherwise
         """
-        client = await self._ensure_connection()
+        client = self._client or await self._ensure_connection()
         result = await client.set(key, value, ex=ex, nx=nx)
         return bool(result)
 
@@ -152,7 +206,7 @@ class RedisClient:
         Returns:
             Number of keys deleted
         """
-        client = await self._ensure_connection()
+        client = self._client or await self._ensure_connection()
         result = await client.delete(*keys)
         return int(result)
 
@@ -166,7 +220,7 @@ class RedisClient:
         Returns:
             True if key exists, False otherwise
         """
-        client = await self._ensure_connection()
+        client = self._client or await self._ensure_connection()
         return bool(await client.exists(key))
 
     async def expire(self, key: str, seconds: int) -> bool:
@@ -180,10 +234,116 @@ class RedisClient:
         Returns:
             True if successful, False otherwise
         """
-        client = await self._ensure_connection()
+        client = self._client or await self._ensure_connection()
         result = await client.expire(key, seconds)
         return bool(result)
 
+    # Atomic Update Operations
+    async def set_keep_ttl(self, key: str, value: str) -> bool:
+        """
+        Replace a value while keeping the key's existing expiration.
+
+        Args:
+            key: Redis key
+            value: Value to set
+
+        Returns:
+            True if successful, False otherwise
+        """
+        client = self._client or await self._ensure_connection()
+        return bool(await client.set(key, value, keepttl=True))
+
+    async def get_set(
+        self, key: str, value: str, ex: Optional[int] = None
+    ) -> Optional[str]:
+        """
+        Set a value and return the previous one in a single command.
+
+        Args:
+            key: Redis key
+            value: Value to set
+            ex: Expiration time in seconds
+
+        Returns:
+            Previous value or None if key didn't exist
+        """
+        client = self._client or await self._ensure_connection()
+        result = await client.set(key, value, ex=ex, get=True)
+        return str(result) if result is not None else None
+
+    async def incr_expire(self, key: str, amount: int = 1, ex: int = 60) -> int:
+        """
+        Increment a counter and refresh its expiration in one round-trip.
+
+        Args:
+            key: Redis key
+            amount: Increment amount
+            ex: Expiration time in seconds
+
+        Returns:
+            Counter value after the increment
+        """
+        async with self.pipeline() as pipe:
+            pipe.incrby(key, amount)
+            pipe.expire(key, ex)
+            value, _ = await pipe.execute()
+        return int(value)
+
+    # Batch Operations
+    async def mget(self, keys: List[str]) -> List[Optional[str]]:
+        """
+        Get values for several keys in one round-trip.
+
+        Args:
+            keys: Redis keys
+
+        Returns:
+            Values in key order, None for keys that don't exist
+        """
+        if not keys:
+            return []
+        client = self._client or await self._ensure_connection()
+        result = await client.mget(keys)
+        return [str(value) if value is not None else None for value in result]
+
+    async def mset(self, mapping: Dict[str, str]) -> bool:
+        """
+        Set several key-value pairs in one round-trip.
+
+        Args:
+            mapping: Key-value mapping
+
+        Returns:
+            True if successful, False otherwise
+        """
+        if not mapping:
+            return True
+        client = self._client or await self._ensure_connection()
+        return bool(await client.mset(mapping))
+
+    @asynccontextmanager
+    async def pipeline(
+        self, transaction: bool = False
+    ) -> AsyncGenerator[redis.client.Pipeline, None]:
+        """
+        Context manager for batching commands into one round-trip.
+
+        Args:
+            transaction: Wrap the batch in MULTI/EXEC if True
+
+        Yields:
+            Pipeline: Redis pipeline; commands are queued until execute()
+
+        Example:
+            async with redis_client.pipeline() as pipe:
+                pipe.get("key1")
+                pipe.hgetall("key2")
+                value, fields = await pipe.execute()
+        """
+        client = self._client or await self._ensure_connection()
+        async with client.pipeline(transaction=transaction) as pipe:
+            yield pipe
+
     # JSON Operations
     async def set_json(self, key: str, data: Any, ex: Optional[int] = None) -> bool:
         """
@@ -198,12 +358,15 @@ class RedisClient:
             True if successful, False otherwise
         """
         try:
-            json_str = json.dumps(data, ensure_ascii=False)
-            return await self.set(key, json_str, ex=ex)
-        except (TypeError, ValueError) as e:
+            # orjson emits UTF-8 bytes, which redis-py writes without re-encoding
+            payload = orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError as e:
             logger.error("Failed to serialize data for key %s: %s", key, str(e))
             return False
 
+        client = self._client or await self._ensure_connection()
+        return bool(await client.set(key, payload, ex=ex))
+
     async def get_json(self, key: str) -> Optional[Any]:
         """
         Get JSON data.
@@ -219,11 +382,39 @@ class RedisClient:
             return None
 
         try:
-            return json.loads(json_str)
-        except (TypeError, ValueError) as e:
+            return orjson.loads(json_str)
+        except orjson.JSONDecodeError as e:
             logger.error("Failed to deserialize data for key %s: %s", key, str(e))
             return None
 
+    async def mset_json(
+        self, mapping: Dict[str, Any], ex: Optional[int] = None
+    ) -> bool:
+        """
+        Set several JSON values in one round-trip.
+
+        Args:
+            mapping: Key to data mapping; each value is serialized to JSON
+            ex: Expiration time in seconds applied to every key
+
+        Returns:
+            True if every key was set, False otherwise
+        """
+        try:
+            payloads = {
+                key: orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+                for key, data in mapping.items()
+            }
+        except TypeError as e:
+            logger.error("Failed to serialize data for batch set: %s", str(e))
+            return False
+
+        async with self.pipeline() as pipe:
+            for key, payload in payloads.items():
+                pipe.set(key, payload, ex=ex)
+            results = await pipe.execute()
+        return all(results)
+
     # Hash Operations
     async def hset(self, name: str, mapping: Dict[str, str]) -> int:
         """
@@ -236,7 +427,7 @@ class RedisClient:
         Returns:
             Number of fields set
         """
-        client = await self._ensure_connection()
+        client = self._client or await self._ensure_connection()
         result = await client.hset(name, mapping=mapping)  # type: ignore[misc]
         return int(result) if result is not None else 0
 
@@ -251,7 +442,7 @@ class RedisClient:
         Returns:
             Field value or None
         """
-        client = await self._ensure_connection()
+        client = self._client or await self._ensure_connection()
         result = await client.hget(name, key)  # type: ignore[misc]
         return str(result) if result is not None else None
 
@@ -265,10 +456,51 @@ class RedisClient:
         Returns:
             Dictionary of field-value pairs
         """
-        client = await self._ensure_connection()
+        client = self._client or await self._ensure_connection()
         result = await client.hgetall(name)  # type: ignore[misc]
         return {str(k): str(v) for k, v in result.items()}
 
+    async def hmget(self, name: str, fields: List[str]) -> List[Optional[str]]:
+        """
+        Get selected hash field values.
+
+        Prefer this over hgetall when only some fields are needed; only the
+        requested values are transferred.
+
+        Args:
+            name: Hash name
+            fields: Field names
+
+        Returns:
+            Values in field order, None for fields that don't exist
+        """
+        if not fields:
+            return []
+        client = self._client or await self._ensure_connection()
+        result = await client.hmget(name, fields)  # type: ignore[misc]
+        return [str(value) if value is not None else None for value in result]
+
+    async def hscan_iter(
+        self, name: str, match: Optional[str] = None, count: int = 1000
+    ) -> AsyncIterator[Tuple[str, str]]:
+        """
+        Iterate over hash fields and values incrementally with HSCAN.
+
+        Unlike hgetall, large hashes are read in batches without blocking Redis
+        or loading the whole hash into memory.
+
+        Args:
+            name: Hash name
+            match: Optional glob pattern for field names
+            count: Hint for the number of fields returned per HSCAN call
+
+        Yields:
+            Tuple of field name and value
+        """
+        client = self._client or await self._ensure_connection()
+        async for field, value in client.hscan_iter(name, match=match, count=count):
+            yield str(field), str(value)
+
     async def hdel(self, name: str, *keys: str) -> int:
         """
         Delete hash fields.
@@ -280,7 +512,7 @@ class RedisClient:
         Returns:
             Number of fields deleted
         """
-        client = await self._ensure_connection()
+        client = self._client or await self._ensure_connection()
         result = await client.hdel(name, *keys)  # type: ignore[misc]
         return int(result)
 
@@ -296,7 +528,7 @@ class RedisClient:
         Returns:
             List length after push
         """
-        client = await self._ensure_connection()
+        client = self._client or await self._ensure_connection()
         result = await client.lpush(name, *values)  # type: ignore[misc]
         return int(result)
 
@@ -311,7 +543,7 @@ class RedisClient:
         Returns:
             List length after push
         """
-        client = await self._ensure_connection()
+        client = self._client or await self._ensure_connection()
         result = await client.rpush(name, *values)  # type: ignore[misc]
         return int(result)
 
@@ -325,7 +557,7 @@ class RedisClient:
         Returns:
             Popped value or None
         """
-        client = await self._ensure_connection()
+        client = self._client or await self._ensure_connection()
         result = await client.lpop(name)  # type: ignore[misc]
         return str(result) if result is not None else None
 
@@ -339,7 +571,7 @@ class RedisClient:
         Returns:
             Popped value or None
         """
-        client = await self._ensure_connection()
+        client = self._client or await self._ensure_connection()
         result = await client.rpop(name)  # type: ignore[misc]
         return str(result) if result is not None else None
 
@@ -355,19 +587,74 @@ class RedisClient:
         Returns:
             List of values
         """
-        client = await self._ensure_connection()
+        client = self._client or await self._ensure_connection()
         result = await client.lrange(name, start, end)  # type: ignore[misc]
         return [str(item) for item in result]
 
+    async def lrange_iter(self, name: str, page_size: int = 1000) -> AsyncIterator[str]:
+        """
+        Iterate over a list in LRANGE pages.
+
+        Memory stays bounded by the page size instead of the full list length.
+        Items pushed or popped during iteration may shift page boundaries.
+
+        Args:
+            name: List name
+            page_size: Number of items fetched per LRANGE call
+
+        Yields:
+            List values in order
+        """
+        client = self._client or await self._ensure_connection()
+        start = 0
+        while True:
+            end = start + page_size - 1
+            page = await client.lrange(name, start, end)  # type: ignore[misc]
+            for item in page:
+                yield str(item)
+            if len(page) < page_size:
+                return
+            start += page_size
+
+    # Pub/Sub Operations
+    async def publish(self, channel: str, message: str) -> int:
+        """
+        Publish a message to a channel.
+
+        Args:
+            channel: Channel name
+            message: Message to publish
+
+        Returns:
+            Number of subscribers that received the message
+        """
+        client = self._client or await self._ensure_connection()
+        return int(await client.publish(channel, message))
+
+    async def pubsub(self) -> PubSub:
+        """
+        Create a pub/sub object on the shared connection pool.
+
+        The caller owns the returned object and must close it with aclose().
+
+        Returns:
+            PubSub: Redis pub/sub object (holds its own connection once subscribed)
+        """
+        client = self._client or await self._ensure_connection()
+        return client.pubsub()
+
     # Distributed Lock Operations
     async def acquire_lock(
-        self, lock_key: str, timeout: int = 30, identifier: Optional[str] = None
+        self,
+        lock_key: Union[str, bytes],
+        timeout: int = 30,
+        identifier: Optional[str] = None,
     ) -> Optional[str]:
         """
         Acquire distributed lock.
 
         Args:
-            lock_key: Lock key
+            lock_key: Lock key (pre-encoded bytes skip per-command encoding)
             timeout: Lock timeout in seconds
             identifier: Lock identifier (auto-generated if None)
 
@@ -376,9 +663,9 @@ class RedisClient:
         """
 
         if identifier is None:
-            identifier = str(uuid.uuid4())
+            identifier = secrets.token_hex(16)
 
-        client = await self._ensure_connection()
+        client = self._client or await self._ensure_connection()
 
         # Try to acquire lock with expiration
         acquired = await client.set(lock_key, identifier, nx=True, ex=timeout)
@@ -390,7 +677,7 @@ class RedisClient:
         logger.debug("Failed to acquire lock: %s", lock_key)
         return None
 
-    async def release_lock(self, lock_key: str, identifier: str) -> bool:
+    async def release_lock(self, lock_key: Union[str, bytes], identifier: str) -> bool:
         """
         Release distributed lock.
 
@@ -401,19 +688,14 @@ class RedisClient:
         Returns:
             True if lock was released, False otherwise
         """
-        client = await self._ensure_connection()
+        client = self._client or await self._ensure_connection()
 
-        # Lua script to ensure atomic check-and-delete
-        lua_script = """
-        if redis.call("get", KEYS[1]) == ARGV[1] then
-            return redis.call("del", KEYS[1])
-        else
-            return 0
-        end
-        """
+        release_script = self._release_script or client.register_script(
+            _RELEASE_LOCK_SCRIPT
+        )
 
         try:
-            result = await client.eval(lua_script, 1, lock_key, identifier)  # type: ignore[misc]
+            result = await release_script(keys=[lock_key], args=[identifier])
             result_int = int(result) if result is not None else 0
             if result_int:
                 logger.debug(
@@ -447,15 +729,21 @@ class RedisClient:
         Raises:
             RedisException: If lock cannot be acquired
         """
-        start_time = time.time()
+        deadline = time.monotonic() + wait_timeout
+        max_delay = settings.redis_lock__retry_sleep_interval
+        delay = min(_LOCK_RETRY_INITIAL_DELAY, max_delay)
         identifier = None
 
-        # Try to acquire lock with retries
-        while time.time() - start_time < wait_timeout:
+        # Try to acquire lock, backing off exponentially with jitter
+        while True:
             identifier = await self.acquire_lock(lock_key, timeout)
             if identifier:
                 break
-            await asyncio.sleep(settings.redis_lock__retry_sleep_interval)
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            await asyncio.sleep(min(delay + random.uniform(0, delay), remaining))
+            delay = min(delay * 2, max_delay)
 
         if not identifier:
             raise RedisException(
@@ -480,11 +768,12 @@ class RedisClient:
             client = await self._ensure_connection()
 
             # Test basic operations
-            start_time = time.time()
+            start_time = time.perf_counter()
             await client.ping()
-            ping_time = time.time() - start_time
+            ping_time = time.perf_counter() - start_time
 
-            # Get Redis info
+            # Read server info on every check so a restarted or failed-over
+            # server is reported correctly
             info = await client.info("server")
 
             # Get connection pool info
@@ -535,7 +824,8 @@ class _RedisClientManager:
 
     def __init__(self) -> None:
         self._client: Optional[RedisClient] = None
-        self._lock = asyncio.Lock()
+        # Created on first async use, inside the event loop that will await it
+        self._lock: Optional[asyncio.Lock] = None
 
     @property
     def client(self) -> Optional[RedisClient]:
@@ -567,6 +857,9 @@ class _RedisClientManager:
         if self._client is not None:
             return self._client
 
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
         async with self._lock:
             if self._client is None:
                 self._client = RedisClient()
@@ -574,6 +867,9 @@ class _RedisClientManager:
 
     async def close_client(self) -> None:
         """Close Redis client and cleanup resources."""
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
         async with self._lock:
             if self._client:
                 await self._client.close()
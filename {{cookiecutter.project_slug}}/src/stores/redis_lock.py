@@ -7,9 +7,12 @@ resume data modification.
 """
 
 import asyncio
+import random
 import time
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator, Optional
+from typing import Any, AsyncGenerator, Dict, Optional, Set
+
+from redis.asyncio.client import PubSub
 
 from src.core.config import settings
 from src.core.error_codes import RedisErrorCode
@@ -22,6 +25,132 @@ from src.stores.redis_client import get_redis_client
 logger = get_logger(__name__)
 
 
+class _ReleaseListener:
+    """
+    Process-wide multiplexer for lock release notifications.
+
+    All waiters in the process share one pub/sub connection. A single reader
+    task dispatches each release message to the events registered for its
+    channel, so connection count does not grow with the number of waiters.
+    The connection and reader stay up between waits and are released by
+    close() at shutdown.
+    """
+
+    def __init__(self) -> None:
+        self._waiters: Dict[str, Set[asyncio.Event]] = {}
+        self._pubsub: Optional[PubSub] = None
+        self._reader: Optional[asyncio.Task] = None
+        # Created on first use, inside the event loop that will await it
+        self._lock: Optional[asyncio.Lock] = None
+
+    async def subscribe(self, channel: str) -> asyncio.Event:
+        """
+        Register a waiter for release notifications on a channel.
+
+        Args:
+            channel: Release channel name
+
+        Returns:
+            asyncio.Event: Event set whenever a release is published
+        """
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        event = asyncio.Event()
+        async with self._lock:
+            if self._pubsub is None:
+                self._pubsub = await get_redis_client().pubsub()
+
+            waiters = self._waiters.get(channel)
+            if waiters is None:
+                await self._pubsub.subscribe(channel)
+                waiters = self._waiters[channel] = set()
+            waiters.add(event)
+
+            if self._reader is None or self._reader.done():
+                self._reader = asyncio.create_task(self._read(self._pubsub))
+        return event
+
+    async def unsubscribe(self, channel: str, event: asyncio.Event) -> None:
+        """
+        Remove a waiter; the channel is unsubscribed when its last waiter leaves.
+
+        Args:
+            channel: Release channel name
+            event: Event returned by subscribe()
+        """
+        if self._lock is None:
+            return
+
+        async with self._lock:
+            waiters = self._waiters.get(channel)
+            if waiters is None:
+                return
+            waiters.discard(event)
+            if waiters:
+                return
+
+            del self._waiters[channel]
+            if self._pubsub is not None:
+                await self._pubsub.unsubscribe(channel)
+
+    async def _read(self, pubsub: PubSub) -> None:
+        """Dispatch release messages to waiters until cancelled or an error."""
+        try:
+            while True:
+                message = await pubsub.get_message(
+                    ignore_subscribe_messages=True, timeout=1.0
+                )
+                if message is None:
+                    continue
+                for event in self._waiters.get(message["channel"], ()):
+                    event.set()
+        except Exception as e:
+            logger.warning("Lock release listener stopped, error: %s", str(e))
+            # Wake everyone so waiters retry at once and fall back to polling
+            for waiters in self._waiters.values():
+                for event in waiters:
+                    event.set()
+            if self._pubsub is pubsub:
+                self._pubsub = None
+                self._waiters.clear()
+                try:
+                    await pubsub.aclose()
+                except Exception:
+                    pass
+
+    async def close(self) -> None:
+        """Stop the reader task and release the pub/sub connection."""
+        if self._lock is None:
+            return
+
+        async with self._lock:
+            # Wake remaining waiters so they fall back to polling
+            for waiters in self._waiters.values():
+                for event in waiters:
+                    event.set()
+            self._waiters.clear()
+
+            reader, self._reader = self._reader, None
+            if reader is not None:
+                reader.cancel()
+            pubsub, self._pubsub = self._pubsub, None
+            if pubsub is not None:
+                await pubsub.aclose()
+
+
+_release_listener = _ReleaseListener()
+
+
+async def close_lock_listener() -> None:
+    """
+    Close the shared lock release listener.
+
+    Should be called during application shutdown, before close_redis_client().
+    """
+    await _release_listener.close()
+
+
 class SessionLock:
     """
     Session-level distributed lock for resume data protection.
@@ -42,20 +171,45 @@ class SessionLock:
         self.session_id = session_id
         self.timeout = timeout
         self.lock_key = f"resume_lock:{session_id}"
+        # Encoded once; redis-py sends bytes keys without re-encoding
+        self._lock_key_bytes = self.lock_key.encode()
+        self.release_channel = f"resume_lock_channel:{session_id}"
         self._redis_client = get_redis_client()
         self._identifier: Optional[str] = None
+        # Reentrancy: task holding the lock and its nested acquire count
+        self._owner_task: Optional["asyncio.Task[Any]"] = None
+        self._depth = 0
 
     @property
     def identifier(self) -> Optional[str]:
         """Get the current lock identifier if acquired."""
         return self._identifier
 
-    async def acquire(self, wait_timeout: int = 10) -> bool:
+    async def acquire(
+        self,
+        wait_timeout: int = 10,
+        base_delay: float = 0.005,
+        max_delay: Optional[float] = None,
+    ) -> bool:
         """
         Acquire distributed lock for the session.
 
+        After a failed attempt the waiter subscribes to the lock's release
+        channel through the process-wide release listener, which shares one
+        pub/sub connection across all waiters, and sleeps until the holder
+        announces a release, retrying early on notification. The exponential
+        backoff with jitter remains as a fallback ticker in case a release
+        notification is missed (for example when the lock expires instead of
+        being released).
+
+        The lock is reentrant per task: if the task that holds it acquires it
+        again, a hold count is incremented without a Redis round trip.
+
         Args:
             wait_timeout: Maximum time to wait for lock acquisition in seconds
+            base_delay: First retry delay in seconds
+            max_delay: Retry delay cap in seconds
+                (uses redis_lock__retry_sleep_interval if None)
 
         Returns:
             bool: True if lock acquired successfully, False otherwise
@@ -63,24 +217,60 @@ class SessionLock:
         Raises:
             RedisException: If Redis operation fails
         """
+        current_task = asyncio.current_task()
+        if self._identifier and self._owner_task is current_task:
+            self._depth += 1
+            return True
+
+        if max_delay is None:
+            max_delay = settings.redis_lock__retry_sleep_interval
+
+        release_event: Optional[asyncio.Event] = None
         try:
-            start_time = time.monotonic()
+            deadline = time.monotonic() + wait_timeout
+            attempt = 0
 
             # Try to acquire lock with retries
-            while (time.monotonic() - start_time) < wait_timeout:
-                self._identifier = await self._redis_client.acquire_lock(
-                    self.lock_key, self.timeout
+            while True:
+                identifier = await self._redis_client.acquire_lock(
+                    self._lock_key_bytes, self.timeout
                 )
 
-                if self._identifier:
+                if identifier:
+                    self._identifier = identifier
+                    self._owner_task = current_task
+                    self._depth = 1
                     logger.info(
                         "Session lock acquired successfully for session: %s",
                         self.session_id,
                     )
                     return True
 
-                # Wait before retry
-                await asyncio.sleep(settings.redis_lock__retry_sleep_interval)
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+
+                if release_event is None:
+                    # Subscribe, then retry at once in case the release
+                    # happened before the subscription was active
+                    release_event = await _release_listener.subscribe(
+                        self.release_channel
+                    )
+                    continue
+
+                # Wait for a release notification, bounded by capped
+                # exponential backoff with jitter and never past the deadline
+                delay = min(max_delay, base_delay * (2**attempt))
+                try:
+                    await asyncio.wait_for(
+                        release_event.wait(),
+                        timeout=min(delay * random.uniform(0.5, 1.5), remaining),
+                    )
+                except asyncio.TimeoutError:
+                    pass
+                release_event.clear()
+                attempt += 1
+
             logger.warning(
                 "Failed to acquire session lock for session: %s within %d seconds",
                 self.session_id,
@@ -98,10 +288,27 @@ class SessionLock:
                 RedisErrorCode.LOCK_FAILED, f"Failed to acquire session lock: {str(e)}"
             ) from e
 
+        finally:
+            if release_event is not None:
+                try:
+                    await _release_listener.unsubscribe(
+                        self.release_channel, release_event
+                    )
+                except Exception as close_error:
+                    logger.debug(
+                        "Failed to close lock release subscription for session: %s, "
+                        "error: %s",
+                        self.session_id,
+                        str(close_error),
+                    )
+
     async def release(self) -> bool:
         """
         Release distributed lock for the session.
 
+        A nested hold only decrements the hold count; Redis is released when
+        the outermost hold is released.
+
         Returns:
             bool: True if lock released successfully, False otherwise
 
@@ -114,9 +321,14 @@ class SessionLock:
                 self.session_id,
             )
             return False
+
+        if self._depth > 1:
+            self._depth -= 1
+            return True
+
         try:
             success = await self._redis_client.release_lock(
-                self.lock_key, self._identifier
+                self._lock_key_bytes, self._identifier
             )
 
             if success:
@@ -124,12 +336,15 @@ class SessionLock:
                     "Session lock released successfully for session: %s",
                     self.session_id,
                 )
+                await self._notify_release()
             else:
                 logger.warning(
                     "Failed to release session lock for session: %s", self.session_id
                 )
 
             self._identifier = None
+            self._owner_task = None
+            self._depth = 0
             return success
 
         except Exception as e:
@@ -142,6 +357,18 @@ class SessionLock:
                 RedisErrorCode.LOCK_FAILED, f"Failed to release session lock: {str(e)}"
             ) from e
 
+    async def _notify_release(self) -> None:
+        """Wake waiters subscribed to this lock's release channel."""
+        try:
+            await self._redis_client.publish(self.release_channel, "released")
+        except Exception as e:
+            # Waiters fall back to their retry ticker; the release itself succeeded
+            logger.warning(
+                "Failed to publish lock release for session: %s, error: %s",
+                self.session_id,
+                str(e),
+            )
+
     @asynccontextmanager
     async def acquire_context(
         self, wait_timeout: int = 10